@@ -1,14 +1,68 @@
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.db.models import Count
 from .models import (
     User, Department, Team, Session, 
     HealthCheckCard, Vote, TeamSummary, DepartmentSummary
 )
-
-class CustomUserAdmin(UserAdmin):
+from .paginators import FasterAdminPaginator
+
+class ChangelistDeferMixin:
+    """
+    Admin mixin that leaves long text columns out of changelist queries.
+    
+    Set changelist_defer to the text fields the changelist does not display.
+    Only the changelist rows are narrowed; change forms still load the full
+    object.
+    """
+    changelist_defer = ()
+    
+    def get_changelist(self, request, **kwargs):
+        changelist_class = super().get_changelist(request, **kwargs)
+        deferred_fields = self.changelist_defer
+        
+        class DeferredChangeList(changelist_class):
+            def get_queryset(self, request):
+                return super().get_queryset(request).defer(*deferred_fields)
+        
+        return DeferredChangeList
+
+
+class TeamListFilter(admin.RelatedFieldListFilter):
+    """
+    Team filter for the changelist sidebar.
+    
+    Team labels include the department name; the default choices load teams
+    without it and fetch each department while rendering, so the departments
+    are joined in here.
+    """
+    
+    def field_choices(self, field, request, model_admin):
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        teams = Team.objects.select_related('department').order_by(*ordering)
+        return [(team.pk, str(team)) for team in teams]
+
+
+class TeamLabelAdminMixin:
+    """
+    Admin mixin that joins departments into team dropdowns on change forms.
+    """
+    
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # Team labels include the department name; join it so the dropdown
+        # renders without a query per team
+        if db_field.name == 'team':
+            kwargs['queryset'] = Team.objects.select_related('department')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
+@admin.register(User)
+class CustomUserAdmin(ChangelistDeferMixin, TeamLabelAdminMixin, UserAdmin):
     list_display = ('username', 'email', 'first_name', 'last_name', 'role', 'department', 'team', 'is_active')
-    list_filter = ('role', 'department', 'team', 'is_active')
+    changelist_defer = ('bio',)
+    list_filter = ('role', 'department', ('team', TeamListFilter), 'is_active')
+    list_select_related = ('department', 'team__department')
     fieldsets = (
         (None, {'fields': ('username', 'password')}),
         ('Personal info', {'fields': ('first_name', 'last_name', 'email', 'bio', 'profile_picture')}),
@@ -27,61 +81,88 @@ class CustomUserAdmin(UserAdmin):
     filter_horizontal = ('groups', 'user_permissions',)
 
 
-class DepartmentAdmin(admin.ModelAdmin):
+@admin.register(Department)
+class DepartmentAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = ('name', 'get_team_count', 'created_at')
+    changelist_defer = ('description',)
     search_fields = ('name',)
     readonly_fields = ('created_at',)
 
+    def get_queryset(self, request):
+        # Annotate team counts so the changelist doesn't count per row
+        return super().get_queryset(request).annotate(team_count=Count('team'))
+
 
-class TeamAdmin(admin.ModelAdmin):
+@admin.register(Team)
+class TeamAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = ('name', 'department', 'get_member_count', 'created_at')
+    changelist_defer = ('description',)
     list_filter = ('department',)
+    list_select_related = ('department',)
     search_fields = ('name', 'department__name')
     readonly_fields = ('created_at',)
 
+    def get_queryset(self, request):
+        # Annotate member counts so the changelist doesn't count per row
+        return super().get_queryset(request).annotate(member_count=Count('user'))
+
 
-class SessionAdmin(admin.ModelAdmin):
+@admin.register(Session)
+class SessionAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = ('name', 'date', 'is_active', 'created_at')
+    changelist_defer = ('description',)
     list_filter = ('is_active', 'date')
     search_fields = ('name', 'description')
     readonly_fields = ('created_at',)
 
 
-class HealthCheckCardAdmin(admin.ModelAdmin):
+@admin.register(HealthCheckCard)
+class HealthCheckCardAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = ('name', 'order', 'active')
+    changelist_defer = ('description',)
     list_filter = ('active',)
     search_fields = ('name', 'description')
     ordering = ('order',)
 
 
-class VoteAdmin(admin.ModelAdmin):
+@admin.register(Vote)
+class VoteAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = ('user', 'card', 'session', 'value', 'progress_note', 'created_at')
+    changelist_defer = ('comment',)
     list_filter = ('value', 'progress_note', 'session', 'card')
-    search_fields = ('user__username', 'comment')
+    list_select_related = ('user', 'card', 'session')
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    list_per_page = 25
+    list_max_show_all = 100
+    # Anchored prefix match on username only; a contains search across the
+    # user join and the comment text cannot use an index
+    search_fields = ('^user__username',)
     readonly_fields = ('created_at', 'updated_at')
     date_hierarchy = 'created_at'
 
 
-class TeamSummaryAdmin(admin.ModelAdmin):
+@admin.register(TeamSummary)
+class TeamSummaryAdmin(TeamLabelAdminMixin, admin.ModelAdmin):
     list_display = ('team', 'session', 'card', 'average_vote', 'progress_summary')
-    list_filter = ('average_vote', 'progress_summary', 'team', 'session', 'card')
+    list_filter = ('average_vote', 'progress_summary', ('team', TeamListFilter), 'session', 'card')
+    list_select_related = ('team__department', 'session', 'card')
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    list_per_page = 25
+    list_max_show_all = 100
     readonly_fields = ('created_at', 'updated_at')
     date_hierarchy = 'created_at'
 
 
+@admin.register(DepartmentSummary)
 class DepartmentSummaryAdmin(admin.ModelAdmin):
     list_display = ('department', 'session', 'card', 'average_vote', 'progress_summary')
     list_filter = ('average_vote', 'progress_summary', 'department', 'session', 'card')
+    list_select_related = ('department', 'session', 'card')
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    list_per_page = 25
+    list_max_show_all = 100
     readonly_fields = ('created_at', 'updated_at')
     date_hierarchy = 'created_at'
-
-
-# Register all models with their custom admin classes
-admin.site.register(User, CustomUserAdmin)
-admin.site.register(Department, DepartmentAdmin)
-admin.site.register(Team, TeamAdmin)
-admin.site.register(Session, SessionAdmin)
-admin.site.register(HealthCheckCard, HealthCheckCardAdmin)
-admin.site.register(Vote, VoteAdmin)
-admin.site.register(TeamSummary, TeamSummaryAdmin)
-admin.site.register(DepartmentSummary, DepartmentSummaryAdmin)
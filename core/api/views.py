@@ -1,28 +1,39 @@
 
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.decorators import login_required
-from core.models import Session, HealthCheckCard, Vote, TeamSummary, User, Team, Department
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Q
+from core.models import Session, HealthCheckCard, Vote, TeamSummary, User, Team, Department, get_current_session_id
 import json
+from collections import defaultdict
+
+# Rendered active-session payload; invalidated by the Session signals in core.signals
+ACTIVE_SESSIONS_CACHE_KEY = 'api:active_sessions'
+ACTIVE_SESSIONS_CACHE_TIMEOUT = 60
 
 @login_required
 @require_http_methods(["GET"])
 def active_sessions(request):
-    """Return all active sessions"""
-    sessions = Session.objects.filter(is_active=True).values('id', 'name', 'description', 'date')
-    return JsonResponse({'sessions': list(sessions)})
+    """Return all active sessions, serving the rendered JSON from cache"""
+    payload = cache.get(ACTIVE_SESSIONS_CACHE_KEY)
+    if payload is None:
+        sessions = Session.objects.filter(is_active=True).values('id', 'name', 'description', 'date')
+        payload = json.dumps({'sessions': list(sessions)}, cls=DjangoJSONEncoder).encode()
+        cache.set(ACTIVE_SESSIONS_CACHE_KEY, payload, ACTIVE_SESSIONS_CACHE_TIMEOUT)
+    return HttpResponse(payload, content_type='application/json')
 
 @login_required
 @require_http_methods(["GET"])
 def session_cards(request, session_id):
     """Return all cards for a specific session"""
-    try:
-        session = Session.objects.get(id=session_id)
-        # Get all active health check cards
-        cards = HealthCheckCard.objects.filter(active=True).values('id', 'name', 'description', 'icon', 'order')
-        return JsonResponse({'cards': list(cards)})
-    except Session.DoesNotExist:
+    # Only the session's existence matters here, so skip loading the row
+    if not Session.objects.filter(id=session_id).exists():
         return JsonResponse({'error': 'Session not found'}, status=404)
+    # Get all active health check cards
+    cards = HealthCheckCard.objects.filter(active=True).values('id', 'name', 'description', 'icon', 'order')
+    return JsonResponse({'cards': list(cards)})
 
 @login_required
 @require_http_methods(["POST"])
@@ -33,14 +44,17 @@ def submit_vote(request, session_id, card_id):
         value = data.get('value')
         progress_note = data.get('progress_note', 'same')
         
-        session = Session.objects.get(id=session_id)
-        card = HealthCheckCard.objects.get(id=card_id)
+        # Existence checks only; the vote is written against the ids directly
+        if not Session.objects.filter(id=session_id).exists():
+            return JsonResponse({'error': 'Session not found'}, status=404)
+        if not HealthCheckCard.objects.filter(id=card_id).exists():
+            return JsonResponse({'error': 'Card not found'}, status=404)
         
         # Create or update vote
         vote, created = Vote.objects.update_or_create(
             user=request.user,
-            card=card,
-            session=session,
+            card_id=card_id,
+            session_id=session_id,
             defaults={'value': value, 'progress_note': progress_note}
         )
         
@@ -49,71 +63,117 @@ def submit_vote(request, session_id, card_id):
             'message': 'Vote submitted successfully',
             'vote_id': vote.id
         })
-    except Session.DoesNotExist:
-        return JsonResponse({'error': 'Session not found'}, status=404)
-    except HealthCheckCard.DoesNotExist:
-        return JsonResponse({'error': 'Card not found'}, status=404)
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=400)
 
 @login_required
-@require_http_methods(["GET"])
-def team_summary(request, team_id):
-    """Return summary data for a specific team"""
+@require_http_methods(["POST"])
+def submit_votes_bulk(request, session_id):
+    """Submit votes for several cards in a session with a single upsert"""
     try:
-        team = Team.objects.get(id=team_id)
-        # Check if user has permission to view this team's data
-        if request.user.role not in ['team_leader', 'department_leader', 'senior_manager'] and request.user.team.id != team_id:
-            return JsonResponse({'error': 'Permission denied'}, status=403)
+        data = json.loads(request.body)
+        # Keep the last entry per card so the upsert never touches a row twice
+        votes = {vote['card_id']: vote for vote in data['votes']}
         
-        summaries = TeamSummary.objects.filter(team=team).values(
-            'id', 'card__name', 'average_vote', 'progress_summary',
-            'green_percentage', 'amber_percentage', 'red_percentage'
+        if not Session.objects.filter(id=session_id).exists():
+            return JsonResponse({'error': 'Session not found'}, status=404)
+        
+        if HealthCheckCard.objects.filter(id__in=votes).count() != len(votes):
+            return JsonResponse({'error': 'Card not found'}, status=404)
+        
+        # Insert new votes and overwrite existing ones in one statement
+        Vote.objects.bulk_create(
+            [
+                Vote(
+                    user=request.user,
+                    card_id=card_id,
+                    session_id=session_id,
+                    value=vote.get('value'),
+                    # bulk_create skips Vote.save, so the score is set here
+                    score=Vote.VALUE_SCORES.get(vote.get('value'), 0),
+                    progress_note=vote.get('progress_note', 'same'),
+                )
+                for card_id, vote in votes.items()
+            ],
+            update_conflicts=True,
+            unique_fields=['user', 'card', 'session'],
+            update_fields=['value', 'score', 'progress_note', 'updated_at'],
         )
-        return JsonResponse({'team_summaries': list(summaries)})
-    except Team.DoesNotExist:
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Votes submitted successfully',
+            'vote_count': len(votes)
+        })
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+@login_required
+@require_http_methods(["GET"])
+def team_summary(request, team_id):
+    """Return summary data for a specific team"""
+    # Check if user has permission to view this team's data before touching the database
+    if request.user.role not in ['team_leader', 'department_leader', 'senior_manager'] and (
+        request.user.team_id != team_id):
+        return JsonResponse({'error': 'Permission denied'}, status=403)
+    
+    summaries = list(TeamSummary.objects.filter(team_id=team_id).order_by('-session__date').values(
+        'id', 'card__name', 'average_vote', 'progress_summary',
+        'green_percentage', 'amber_percentage', 'red_percentage'
+    ))
+    # Only an empty result needs the extra existence check
+    if not summaries and not Team.objects.filter(id=team_id).exists():
         return JsonResponse({'error': 'Team not found'}, status=404)
+    return JsonResponse({'team_summaries': summaries})
 
 @login_required
 @require_http_methods(["GET"])
 def department_summary(request, department_id):
     """Return summary data for a specific department"""
-    try:
-        department = Department.objects.get(id=department_id)
-        # Check if user has permission to view this department's data
-        if request.user.role not in ['department_leader', 'senior_manager'] and (
-            not hasattr(request.user, 'department') or request.user.department.id != department_id):
-            return JsonResponse({'error': 'Permission denied'}, status=403)
-        
-        teams = Team.objects.filter(department=department).values('id', 'name')
-        team_data = []
-        
-        for team in teams:
-            summaries = TeamSummary.objects.filter(team_id=team['id']).values(
-                'id', 'card__name', 'average_vote', 'progress_summary'
-            )
-            team_data.append({
-                'team': team,
-                'summaries': list(summaries)
-            })
-        
-        return JsonResponse({'department_teams': team_data})
-    except Department.DoesNotExist:
+    # Check if user has permission to view this department's data before touching the database
+    # Compare the FK column directly so the department row isn't loaded
+    if request.user.role not in ['department_leader', 'senior_manager'] and (
+        request.user.department_id != department_id):
+        return JsonResponse({'error': 'Permission denied'}, status=403)
+    
+    teams = list(Team.objects.filter(department_id=department_id).values('id', 'name'))
+    # Only an empty result needs the extra existence check
+    if not teams and not Department.objects.filter(id=department_id).exists():
         return JsonResponse({'error': 'Department not found'}, status=404)
+    
+    # Fetch every team's summaries in one query and bucket them by team
+    summaries_by_team = defaultdict(list)
+    summaries = TeamSummary.objects.filter(team__department_id=department_id).order_by('-session__date').values(
+        'team_id', 'id', 'card__name', 'average_vote', 'progress_summary'
+    )
+    for summary in summaries:
+        summaries_by_team[summary.pop('team_id')].append(summary)
+    
+    team_data = [
+        {'team': team, 'summaries': summaries_by_team.get(team['id'], [])}
+        for team in teams
+    ]
+    
+    return JsonResponse({'department_teams': team_data})
 
 @login_required
 @require_http_methods(["GET"])
 def user_progress(request):
     """Return user's voting progress"""
     user = request.user
-    active_sessions = Session.objects.filter(is_active=True)
+    # Cached id of the most recent active session; None short-circuits below
+    session_id = get_current_session_id()
     
-    if not active_sessions:
+    if session_id is None:
         return JsonResponse({'error': 'No active sessions'}, status=404)
     
-    session = active_sessions.first()
-    total_cards = HealthCheckCard.objects.filter(active=True).count()
-    user_votes = Vote.objects.filter(user=user, session=session).count()
+    # Count active cards and the user's votes on them in one conditional aggregate
+    counts = HealthCheckCard.objects.filter(active=True).aggregate(
+        total_cards=Count('id', distinct=True),
+        user_votes=Count('vote', filter=Q(vote__user=user, vote__session_id=session_id)),
+    )
+    total_cards = counts['total_cards']
+    user_votes = counts['user_votes']
     
     return JsonResponse({
         'total_cards': total_cards,
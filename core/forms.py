@@ -16,9 +16,104 @@ data integrity and improve user experience.
 
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm, PasswordChangeForm
+from django.core.cache import cache
 from .models import User, Vote, Session, Team, Department, HealthCheckCard
 
-class UserRegistrationForm(UserCreationForm):
+# Team ids per department are cached briefly since teams rarely change;
+# core.signals drops the entry whenever a team is saved or deleted
+TEAM_IDS_CACHE_TIMEOUT = 300
+
+# Shared textarea widgets; every form field deep-copies its widget, so a
+# single instance can back all of the forms below
+TEXTAREA_WIDGET = forms.Textarea(attrs={'rows': 4})
+COMMENT_WIDGET = forms.Textarea(attrs={'rows': 3, 'placeholder': 'Optional comment'})
+
+# Roles open to self-registration; admin can only be assigned through the Django admin
+NON_ADMIN_ROLES = tuple(choice for choice in User.ROLES if choice[0] != 'admin')
+
+
+def team_ids_cache_key(department_id):
+    """
+    Build the cache key holding the team ids of a department.
+    
+    Args:
+        department_id: Primary key of the department
+        
+    Returns:
+        String cache key
+    """
+    return f'teams:dep:{department_id}'
+
+
+def get_department_teams(department_id):
+    """
+    Return a queryset of the teams in a department, using cached team ids.
+    
+    The department's team ids are looked up once and cached, so repeated form
+    instantiations only need a primary-key lookup to render the team choices.
+    
+    Args:
+        department_id: Primary key of the department
+        
+    Returns:
+        QuerySet of Team objects belonging to the department
+    """
+    key = team_ids_cache_key(department_id)
+    team_ids = cache.get(key)
+    if team_ids is None:
+        team_ids = list(Team.objects.filter(department_id=department_id).values_list('id', flat=True))
+        cache.set(key, team_ids, TEAM_IDS_CACHE_TIMEOUT)
+    # Team labels read the department name, so join it and load only the rendered columns
+    return (
+        Team.objects.filter(pk__in=team_ids)
+        .select_related('department')
+        .only('id', 'name', 'department__name')
+        .order_by('name')
+    )
+
+class DepartmentTeamMixin:
+    """
+    Mixin for user forms with dependent department and team dropdowns.
+    
+    The department dropdown lists all departments, while the team dropdown only
+    lists the teams of the department selected in the submitted data, or of the
+    user's current department when editing an existing user. With no department
+    the team dropdown is empty.
+    
+    Must precede the Django form class in the bases so its __init__ runs after
+    the form fields have been built.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the form and filter the team dropdown by department.
+        
+        Args:
+            *args: Variable length argument list
+            **kwargs: Arbitrary keyword arguments
+        """
+        super().__init__(*args, **kwargs)
+        # Department labels are just the name
+        self.fields['department'].queryset = Department.objects.only('id', 'name').order_by('name')
+        
+        department_id = None
+        # A department selected in the form data takes precedence
+        if 'department' in self.data:
+            try:
+                department_id = int(self.data.get('department'))
+            except (ValueError, TypeError):
+                pass
+        # If editing an existing user, show teams from their current department;
+        # department_id avoids fetching the related department row
+        elif self.instance.pk and self.instance.department_id:
+            department_id = self.instance.department_id
+        
+        if department_id is None:
+            self.fields['team'].queryset = Team.objects.none()
+        else:
+            self.fields['team'].queryset = get_department_teams(department_id)
+
+class UserRegistrationForm(DepartmentTeamMixin, UserCreationForm):
     """
     Form for registering new users in the health check system.
     
@@ -50,11 +145,8 @@ class UserRegistrationForm(UserCreationForm):
         """
         Initialize the UserRegistrationForm with dynamic field behavior.
         
-        This method customizes the form initialization to:
-        1. Remove the 'admin' role from available choices for security
-        2. Set up the department dropdown with all departments
-        3. Initialize the team dropdown as empty
-        4. Implement dynamic filtering of teams based on selected department
+        Removes the 'admin' role from the available choices for security; the
+        department and team dropdowns are set up by DepartmentTeamMixin.
         
         Args:
             *args: Variable length argument list
@@ -62,26 +154,9 @@ class UserRegistrationForm(UserCreationForm):
         """
         super().__init__(*args, **kwargs)
         # Remove admin from role choices for security
-        self.fields['role'].choices = [choice for choice in User.ROLES if choice[0] != 'admin']
-        
-        # Initialize department dropdown with all departments
-        self.fields['department'].queryset = Department.objects.all()
-        
-        # Initialize team dropdown as empty (will be populated based on department)
-        self.fields['team'].queryset = Team.objects.none()
-        
-        # If a department is selected in the form data, filter teams accordingly
-        if 'department' in self.data:
-            try:
-                department_id = int(self.data.get('department'))
-                self.fields['team'].queryset = Team.objects.filter(department_id=department_id)
-            except (ValueError, TypeError):
-                pass
-        # If editing an existing user, show teams from their current department
-        elif self.instance.pk and self.instance.department:
-            self.fields['team'].queryset = Team.objects.filter(department=self.instance.department)
+        self.fields['role'].choices = NON_ADMIN_ROLES
 
-class UserProfileForm(UserChangeForm):
+class UserProfileForm(DepartmentTeamMixin, UserChangeForm):
     """
     Form for editing user profiles in the health check system.
     
@@ -111,43 +186,9 @@ class UserProfileForm(UserChangeForm):
         fields = ('first_name', 'last_name', 'email', 'department', 'team', 'profile_picture', 'bio')
         widgets = {
             # Use a larger textarea for the bio field
-            'bio': forms.Textarea(attrs={'rows': 4}),
+            'bio': TEXTAREA_WIDGET,
         }
-        
-    def __init__(self, *args, **kwargs):
-        """
-        Initialize the UserProfileForm with dynamic field behavior.
-        
-        This method customizes the form initialization to:
-        1. Set up the department dropdown with all departments
-        2. Initialize the team dropdown as empty
-        3. Implement dynamic filtering of teams based on selected department
-        
-        The behavior is similar to the registration form but without the
-        role field restrictions.
-        
-        Args:
-            *args: Variable length argument list
-            **kwargs: Arbitrary keyword arguments
-        """
-        super().__init__(*args, **kwargs)
-        
-        # Initialize department dropdown with all departments
-        self.fields['department'].queryset = Department.objects.all()
-        
-        # Initialize team dropdown as empty (will be populated based on department)
-        self.fields['team'].queryset = Team.objects.none()
-        
-        # If a department is selected in the form data, filter teams accordingly
-        if 'department' in self.data:
-            try:
-                department_id = int(self.data.get('department'))
-                self.fields['team'].queryset = Team.objects.filter(department_id=department_id)
-            except (ValueError, TypeError):
-                pass
-        # If editing an existing user, show teams from their current department
-        elif self.instance.pk and self.instance.department:
-            self.fields['team'].queryset = Team.objects.filter(department=self.instance.department)
+
 
 class VoteForm(forms.ModelForm):
     """
@@ -167,7 +208,7 @@ class VoteForm(forms.ModelForm):
     # Override the comment field to customize its widget
     comment = forms.CharField(
         required=False,  # Comments are optional
-        widget=forms.Textarea(attrs={'rows': 3, 'placeholder': 'Optional comment'})
+        widget=COMMENT_WIDGET
     )
     
     class Meta:
@@ -221,7 +262,7 @@ class SessionForm(forms.ModelForm):
             # Use HTML5 date picker for better date selection
             'date': forms.DateInput(attrs={'type': 'date'}),
             # Use a larger textarea for the description
-            'description': forms.Textarea(attrs={'rows': 4}),
+            'description': TEXTAREA_WIDGET,
         }
 
 class TeamForm(forms.ModelForm):
@@ -250,7 +291,7 @@ class TeamForm(forms.ModelForm):
         fields = ('name', 'department', 'description')
         widgets = {
             # Use a larger textarea for the description
-            'description': forms.Textarea(attrs={'rows': 4}),
+            'description': TEXTAREA_WIDGET,
         }
 
 class DepartmentForm(forms.ModelForm):
@@ -279,7 +320,7 @@ class DepartmentForm(forms.ModelForm):
         fields = ('name', 'description')
         widgets = {
             # Use a larger textarea for the description
-            'description': forms.Textarea(attrs={'rows': 4}),
+            'description': TEXTAREA_WIDGET,
         }
 
 class HealthCheckCardForm(forms.ModelForm):
@@ -310,7 +351,7 @@ class HealthCheckCardForm(forms.ModelForm):
         fields = ('name', 'description', 'icon', 'order', 'active')
         widgets = {
             # Use a larger textarea for the description
-            'description': forms.Textarea(attrs={'rows': 4}),
+            'description': TEXTAREA_WIDGET,
         }
 
 class SessionSelectionForm(forms.Form):
@@ -324,10 +365,26 @@ class SessionSelectionForm(forms.Form):
     By default, it only shows active sessions to focus on current health checks.
     """
     session = forms.ModelChoiceField(
-        queryset=Session.objects.filter(is_active=True),  # Only show active sessions
+        queryset=Session.objects.none(),  # Set per instance in __init__
         empty_label="Select a session",  # Default empty option text
         required=True  # A session must be selected
     )
+    
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the SessionSelectionForm with the active sessions.
+        
+        Only the columns used to render and validate the choices are loaded.
+        
+        Args:
+            *args: Variable length argument list
+            **kwargs: Arbitrary keyword arguments
+        """
+        super().__init__(*args, **kwargs)
+        # Only show active sessions, newest first
+        self.fields['session'].queryset = (
+            Session.objects.filter(is_active=True).only('id', 'name', 'date').order_by('-date')
+        )
 
 class DateRangeForm(forms.Form):
     """
@@ -344,6 +401,27 @@ class DateRangeForm(forms.Form):
     # End date with HTML5 date picker
     end_date = forms.DateField(widget=forms.DateInput(attrs={'type': 'date'}))
     
+class TeamChoiceField(forms.ModelChoiceField):
+    """
+    Team dropdown labelled with team names only.
+    
+    Team.__str__ appends the department name, which costs a query per option
+    unless the department is joined in. Selection dropdowns are usually already
+    scoped to one department, so the plain team name is label enough.
+    """
+    
+    def label_from_instance(self, obj):
+        """
+        Return the option label for a team.
+        
+        Args:
+            obj: Team object being rendered as an option
+            
+        Returns:
+            The team's name
+        """
+        return obj.name
+
 class TeamSelectionForm(forms.Form):
     """
     Form for selecting a team in various views.
@@ -355,8 +433,8 @@ class TeamSelectionForm(forms.Form):
     The form can be initialized with a department parameter to filter the teams
     shown in the dropdown, making it easier to find the relevant team.
     """
-    team = forms.ModelChoiceField(
-        queryset=Team.objects.all(),  # Default to all teams
+    team = TeamChoiceField(
+        queryset=Team.objects.none(),  # Set per instance in __init__
         empty_label="Select a team",  # Default empty option text
         required=True  # A team must be selected
     )
@@ -374,6 +452,9 @@ class TeamSelectionForm(forms.Form):
             **kwargs: Arbitrary keyword arguments
         """
         super().__init__(*args, **kwargs)
+        # Options are labelled with the team name alone, so no other columns are needed
+        teams = Team.objects.only('id', 'name').order_by('name')
         # If a department is provided, filter teams to only show those in that department
         if department:
-            self.fields['team'].queryset = Team.objects.filter(department=department)
+            teams = teams.filter(department=department)
+        self.fields['team'].queryset = teams
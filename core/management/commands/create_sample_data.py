@@ -1,12 +1,23 @@
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.utils import timezone
-from core.models import Department, Team, HealthCheckCard, Session
+from core.api.views import ACTIVE_SESSIONS_CACHE_KEY
+from core.models import Department, Team, HealthCheckCard, Session, CURRENT_SESSION_CACHE_KEY
+from core.signals import invalidate_cache_keys
+from datetime import timedelta
+
+# Spacing between the sample health check sessions
+SESSION_INTERVAL = timedelta(days=30)
 
 class Command(BaseCommand):
     help = 'Creates sample data for the Health Check system'
 
+    # Run as one transaction: a single commit for the whole load, and no
+    # half-populated database if a step fails
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         User = get_user_model()
         
@@ -61,10 +72,12 @@ class Command(BaseCommand):
         
         sessions = [
             Session(name="April 2025 Health Check", date=today, description="Monthly health check for April 2025", is_active=True),
-            Session(name="March 2025 Health Check", date=today - timezone.timedelta(days=30), description="Monthly health check for March 2025", is_active=False),
-            Session(name="February 2025 Health Check", date=today - timezone.timedelta(days=60), description="Monthly health check for February 2025", is_active=False),
+            Session(name="March 2025 Health Check", date=today - SESSION_INTERVAL, description="Monthly health check for March 2025", is_active=False),
+            Session(name="February 2025 Health Check", date=today - 2 * SESSION_INTERVAL, description="Monthly health check for February 2025", is_active=False),
         ]
         Session.objects.bulk_create(sessions)
+        # bulk_create sends no post_save, so drop the cached session lookups directly
+        invalidate_cache_keys(ACTIVE_SESSIONS_CACHE_KEY, CURRENT_SESSION_CACHE_KEY)
         
         # Create sample admin user if not exists
         if not User.objects.filter(username='admin').exists():
@@ -76,46 +89,48 @@ class Command(BaseCommand):
             )
             self.stdout.write('Created superuser: admin (password: adminpassword)')
         
-        # Create sample department leader
-        if not User.objects.filter(username='deptleader').exists():
-            dept_leader = User.objects.create_user(
+        # Create sample department leader, team leader, and engineer if not existing.
+        # They share one password, so it is hashed once instead of once per user
+        default_password = make_password('password123')
+        sample_users = [
+            User(
                 username='deptleader',
                 email='deptleader@example.com',
-                password='password123',
+                password=default_password,
                 role='department_leader',
                 department=departments[0],
                 first_name='Department',
                 last_name='Leader'
-            )
-            self.stdout.write('Created department leader: deptleader (password: password123)')
-        
-        # Create sample team leader
-        if not User.objects.filter(username='teamleader').exists():
-            team_leader = User.objects.create_user(
+            ),
+            User(
                 username='teamleader',
                 email='teamleader@example.com',
-                password='password123',
+                password=default_password,
                 role='team_leader',
                 department=departments[0],
                 team=software_teams[0],
                 first_name='Team',
                 last_name='Leader'
-            )
-            self.stdout.write('Created team leader: teamleader (password: password123)')
-        
-        # Create sample engineer
-        if not User.objects.filter(username='engineer').exists():
-            engineer = User.objects.create_user(
+            ),
+            User(
                 username='engineer',
                 email='engineer@example.com',
-                password='password123',
+                password=default_password,
                 role='engineer',
                 department=departments[0],
                 team=software_teams[0],
                 first_name='Sample',
                 last_name='Engineer'
-            )
-            self.stdout.write('Created engineer: engineer (password: password123)')
+            ),
+        ]
+        existing_usernames = set(
+            User.objects.filter(username__in=[user.username for user in sample_users])
+            .values_list('username', flat=True)
+        )
+        new_users = [user for user in sample_users if user.username not in existing_usernames]
+        User.objects.bulk_create(new_users)
+        for user in new_users:
+            self.stdout.write(f'Created {user.get_role_display().lower()}: {user.username} (password: password123)')
             
         self.stdout.write(self.style.SUCCESS('Successfully created sample data!'))
         self.stdout.write('You can now login with the following credentials:')
@@ -1,171 +1,324 @@
 
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from django.utils import timezone
 from django.contrib.auth.hashers import make_password
 from core.models import (
     User, Team, Department, Session, HealthCheckCard,
-    Vote, TeamSummary, DepartmentSummary
+    Vote, TeamSummary, DepartmentSummary, CURRENT_SESSION_CACHE_KEY
 )
-import random
-from datetime import timedelta
+from core.api.views import ACTIVE_SESSIONS_CACHE_KEY
+from core.forms import team_ids_cache_key
+from core.signals import deferred_cache_invalidation, invalidate_cache_keys
+from core.views import rebuild_summaries
+import numpy as np
+from itertools import islice
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+# psycopg2 is optional; without it votes are always written through the ORM
+try:
+    from psycopg2.extras import execute_values
+except ImportError:
+    execute_values = None
+
+# Spacing between the monthly sample sessions
+SESSION_INTERVAL = timedelta(days=30)
+
+# Sample departments and health check cards, created once and reused on later runs
+DEPARTMENT_NAMES = ('Engineering', 'Product', 'Marketing', 'Customer Support', 'Finance')
+CARD_DATA = (
+    {
+        'name': 'Team Collaboration',
+        'description': 'How well does the team collaborate and communicate?',
+        'icon': 'bi bi-people',
+        'order': 1
+    },
+    {
+        'name': 'Technical Quality',
+        'description': 'How is the quality of our technical solutions and code?',
+        'icon': 'bi bi-code-square',
+        'order': 2
+    },
+    {
+        'name': 'Project Management',
+        'description': 'How well are our projects planned and executed?',
+        'icon': 'bi bi-kanban',
+        'order': 3
+    },
+    {
+        'name': 'Learning & Growth',
+        'description': 'Are we continuously learning and improving our skills?',
+        'icon': 'bi bi-graph-up',
+        'order': 4
+    },
+    {
+        'name': 'Customer Focus',
+        'description': 'How well do we understand and address customer needs?',
+        'icon': 'bi bi-bullseye',
+        'order': 5
+    },
+    {
+        'name': 'Code Review Process',
+        'description': 'How effective is our code review process?',
+        'icon': 'bi bi-code-slash',
+        'order': 6
+    },
+    {
+        'name': 'DevOps Practices',
+        'description': 'How well are we implementing DevOps practices?',
+        'icon': 'bi bi-gear',
+        'order': 7
+    },
+    {
+        'name': 'Documentation',
+        'description': 'How complete and useful is our documentation?',
+        'icon': 'bi bi-file-text',
+        'order': 8
+    },
+    {
+        'name': 'Work-Life Balance',
+        'description': 'How is the team\'s work-life balance?',
+        'icon': 'bi bi-life-preserver',
+        'order': 9
+    },
+    {
+        'name': 'Innovation',
+        'description': 'How well do we foster and implement innovation?',
+        'icon': 'bi bi-lightbulb',
+        'order': 10
+    }
+)
+
+# Choices drawn for each sample vote
+VOTE_VALUES = ('green', 'amber', 'red')
+PROGRESS_NOTES = ('better', 'same', 'worse')
+
+# Default number of votes written per INSERT when flushing pending votes
+VOTE_BATCH_SIZE = 500
+# Number of users written per INSERT
+USER_BATCH_SIZE = 200
+
+def insert_votes(rows, batch_size=VOTE_BATCH_SIZE):
+    """
+    Insert sample votes, skipping any that already exist.
+    
+    On PostgreSQL with psycopg2 the rows are sent straight to a multi-row
+    INSERT ... ON CONFLICT DO NOTHING through execute_values, and on SQLite to
+    a prepared INSERT OR IGNORE run through executemany; both skip model
+    instantiation entirely and consume the rows as a stream, completing each
+    tuple as it is sent rather than building a second list of the batch.
+    Other databases and drivers fall back to the ORM's bulk_create with
+    ignore_conflicts. No path calls save() or sends model signals, so each
+    row's score is derived from its value here, and its created_at is kept as
+    given because the field only has a default rather than auto_now_add.
+    
+    Args:
+        rows: List of (user_id, session_id, card_id, value, progress_note, comment, created_at) tuples
+        batch_size: Maximum number of rows per INSERT statement
+    """
+    scores = Vote.VALUE_SCORES
+    # execute_values needs the connection to be running on psycopg2, not psycopg 3
+    if connection.vendor == 'postgresql' and execute_values is not None and connection.Database.__name__ == 'psycopg2':
+        # Raw SQL bypasses auto_now, so updated_at is supplied explicitly
+        now = timezone.now()
+        with connection.cursor() as cursor:
+            execute_values(
+                cursor.cursor,
+                f'INSERT INTO {Vote._meta.db_table} '
+                '(user_id, session_id, card_id, value, progress_note, comment, created_at, score, updated_at) '
+                'VALUES %s ON CONFLICT (user_id, card_id, session_id) DO NOTHING',
+                (row + (scores[row[3]], now) for row in rows),
+                page_size=batch_size,
+            )
+        return
+    
+    if connection.vendor == 'sqlite':
+        # The statement is prepared once and rebound per row; datetimes are
+        # adapted the way the ORM stores them since raw SQL bypasses the fields
+        adapt = connection.ops.adapt_datetimefield_value
+        now = adapt(timezone.now())
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT OR IGNORE INTO {Vote._meta.db_table} '
+                '(user_id, session_id, card_id, value, progress_note, comment, created_at, score, updated_at) '
+                'VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)',
+                (row[:6] + (adapt(row[6]), scores[row[3]], now) for row in rows),
+            )
+        return
+    
+    Vote.objects.bulk_create(
+        [
+            Vote(
+                user_id=user_id,
+                session_id=session_id,
+                card_id=card_id,
+                value=value,
+                score=scores[value],
+                progress_note=progress_note,
+                comment=comment,
+                created_at=created_at,
+            )
+            for user_id, session_id, card_id, value, progress_note, comment, created_at in rows
+        ],
+        batch_size=batch_size,
+        ignore_conflicts=True,
+    )
+
+def bulk_get_or_create(queryset, candidates, key):
+    """
+    Fetch existing rows and bulk-insert the missing candidates.
+    
+    A batched replacement for calling get_or_create per object: one SELECT finds
+    the existing rows, one INSERT creates the rest. On backends that return
+    primary keys from bulk inserts the new objects are used as-is; elsewhere
+    the rows are reloaded so every object has a primary key.
+    
+    Args:
+        queryset: QuerySet covering every row the candidates could match
+        candidates: Unsaved model instances to create if missing
+        key: Function mapping an instance to its identifying tuple or value
+        
+    Returns:
+        Tuple of (dict of key to saved instance, set of keys that already existed)
+    """
+    objects = {key(obj): obj for obj in queryset}
+    existing_keys = set(objects)
+    missing = [obj for obj in candidates if key(obj) not in existing_keys]
+    queryset.model.objects.bulk_create(missing)
+    if connection.features.can_return_rows_from_bulk_insert:
+        objects.update((key(obj), obj) for obj in missing)
+    elif missing:
+        objects = {key(obj): obj for obj in queryset.all()}
+    return objects, existing_keys
 
 class Command(BaseCommand):
     help = 'Generates active data with users, teams, departments, and active sessions'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=VOTE_BATCH_SIZE,
+            help=f'Number of votes written per INSERT (default: {VOTE_BATCH_SIZE})',
+        )
+
+    # Run as one transaction: a single commit for the whole load, and no
+    # half-populated database if a step fails
+    @transaction.atomic
+    # Signal-driven cache invalidations are batched until the load commits
+    @deferred_cache_invalidation()
     def handle(self, *args, **kwargs):
+        # Per-object lines are only written at --verbosity 2 or higher; the
+        # default output is one summary line per step
+        verbose = kwargs.get('verbosity', 1) >= 2
+        batch_size = kwargs.get('batch_size') or VOTE_BATCH_SIZE
+        # One generator supplies every random draw, in vectorized batches
+        rng = np.random.default_rng()
+        # Sample data can be regenerated, so on PostgreSQL the load's commit does
+        # not wait for its WAL flush; SET LOCAL reverts when the transaction ends.
+        # Foreign keys need no SET CONSTRAINTS, Django already creates them deferred
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL synchronous_commit = OFF')
         self.stdout.write('Creating sample data for the health check system...')
         
-        # Create departments
-        departments = []
-        dept_names = ['Engineering', 'Product', 'Marketing', 'Customer Support', 'Finance']
-        
-        for name in dept_names:
-            dept, created = Department.objects.get_or_create(
-                name=name,
-                defaults={
-                    'description': f'{name} department responsible for {name.lower()} activities.'
-                }
-            )
-            departments.append(dept)
-            action = 'Created' if created else 'Found existing'
-            self.stdout.write(f'{action} department: {name}')
-        
-        # Create teams for each department
-        teams = []
-        for dept in departments:
-            # Create 2-3 teams per department
-            num_teams = random.randint(2, 3)
-            for i in range(1, num_teams + 1):
-                team_name = f'{dept.name} Team {i}'
-                team, created = Team.objects.get_or_create(
-                    name=team_name,
-                    department=dept,
-                    defaults={
-                        'description': f'Team {i} in the {dept.name} department.'
-                    }
+        # Create departments, looking up existing ones in one query and
+        # inserting the missing ones in one batch
+        depts_by_name, existing_depts = bulk_get_or_create(
+            Department.objects.filter(name__in=DEPARTMENT_NAMES),
+            [
+                Department(
+                    name=name,
+                    description=f'{name} department responsible for {name.lower()} activities.'
                 )
-                teams.append(team)
-                action = 'Created' if created else 'Found existing'
-                self.stdout.write(f'{action} team: {team_name}')
+                for name in DEPARTMENT_NAMES
+            ],
+            key=lambda dept: dept.name
+        )
+        if verbose:
+            for name in DEPARTMENT_NAMES:
+                action = 'Found existing' if name in existing_depts else 'Created'
+                self.stdout.write(f'{action} department: {name}')
+        departments = [depts_by_name[name] for name in DEPARTMENT_NAMES]
         
-        # Create health check cards
-        cards = []
-        card_data = [
-            {
-                'name': 'Team Collaboration',
-                'description': 'How well does the team collaborate and communicate?',
-                'icon': 'bi bi-people',
-                'order': 1
-            },
-            {
-                'name': 'Technical Quality',
-                'description': 'How is the quality of our technical solutions and code?',
-                'icon': 'bi bi-code-square',
-                'order': 2
-            },
-            {
-                'name': 'Project Management',
-                'description': 'How well are our projects planned and executed?',
-                'icon': 'bi bi-kanban',
-                'order': 3
-            },
-            {
-                'name': 'Learning & Growth',
-                'description': 'Are we continuously learning and improving our skills?',
-                'icon': 'bi bi-graph-up',
-                'order': 4
-            },
-            {
-                'name': 'Customer Focus',
-                'description': 'How well do we understand and address customer needs?',
-                'icon': 'bi bi-bullseye',
-                'order': 5
-            },
-            {
-                'name': 'Code Review Process',
-                'description': 'How effective is our code review process?',
-                'icon': 'bi bi-code-slash',
-                'order': 6
-            },
-            {
-                'name': 'DevOps Practices',
-                'description': 'How well are we implementing DevOps practices?',
-                'icon': 'bi bi-gear',
-                'order': 7
-            },
-            {
-                'name': 'Documentation',
-                'description': 'How complete and useful is our documentation?',
-                'icon': 'bi bi-file-text',
-                'order': 8
-            },
-            {
-                'name': 'Work-Life Balance',
-                'description': 'How is the team\'s work-life balance?',
-                'icon': 'bi bi-life-preserver',
-                'order': 9
-            },
-            {
-                'name': 'Innovation',
-                'description': 'How well do we foster and implement innovation?',
-                'icon': 'bi bi-lightbulb',
-                'order': 10
-            }
+        # Create 2-3 teams per department the same way
+        team_counts = rng.integers(2, 4, size=len(departments)).tolist()
+        planned_teams = [
+            Team(name=f'{dept.name} Team {i}', department=dept, description=f'Team {i} in the {dept.name} department.')
+            for dept, num_teams in zip(departments, team_counts)
+            for i in range(1, num_teams + 1)
         ]
+        teams_by_key, existing_teams = bulk_get_or_create(
+            Team.objects.filter(department__in=departments),
+            planned_teams,
+            key=lambda team: (team.department_id, team.name)
+        )
+        if verbose:
+            for team in planned_teams:
+                action = 'Found existing' if (team.department_id, team.name) in existing_teams else 'Created'
+                self.stdout.write(f'{action} team: {team.name}')
+        teams = [teams_by_key[(team.department_id, team.name)] for team in planned_teams]
+        # bulk_create sends no signals, so drop the cached team ids of every seeded department
+        invalidate_cache_keys(*[team_ids_cache_key(dept.id) for dept in departments])
         
-        for data in card_data:
-            card, created = HealthCheckCard.objects.get_or_create(
-                name=data['name'],
-                defaults={
-                    'description': data['description'],
-                    'icon': data['icon'],
-                    'order': data['order'],
-                    'active': True
-                }
-            )
-            cards.append(card)
-            action = 'Created' if created else 'Found existing'
-            self.stdout.write(f'{action} health check card: {data["name"]}')
+        self.stdout.write(f'Prepared {len(departments)} departments and {len(teams)} teams')
         
-        # Create sessions (past and current)
-        sessions = []
-        today = timezone.now().date()
+        # Create health check cards
+        card_names = [data['name'] for data in CARD_DATA]
+        cards_by_name, existing_cards = bulk_get_or_create(
+            HealthCheckCard.objects.filter(name__in=card_names),
+            [HealthCheckCard(**data, active=True) for data in CARD_DATA],
+            key=lambda card: card.name
+        )
+        if verbose:
+            for name in card_names:
+                action = 'Found existing' if name in existing_cards else 'Created'
+                self.stdout.write(f'{action} health check card: {name}')
+        cards = [cards_by_name[name] for name in card_names]
         
-        # Create 3 past sessions
-        for i in range(3, 0, -1):
-            session_date = today - timedelta(days=i * 30)
-            session_name = f'Monthly Health Check {session_date.strftime("%B %Y")}'
-            session, created = Session.objects.get_or_create(
-                date=session_date,
-                defaults={
-                    'name': session_name,
-                    'description': f'Monthly health check session for {session_date.strftime("%B %Y")}',
-                    'is_active': False
-                }
-            )
-            sessions.append(session)
-            action = 'Created' if created else 'Found existing'
-            self.stdout.write(f'{action} past session: {session_name}')
+        self.stdout.write(f'Prepared {len(cards)} health check cards')
         
-        # Create current active session
-        current_session_name = f'Monthly Health Check {today.strftime("%B %Y")}'
-        current_session, created = Session.objects.get_or_create(
-            date=today,
-            defaults={
-                'name': current_session_name,
-                'description': f'Current monthly health check session for {today.strftime("%B %Y")}',
-                'is_active': True
-            }
+        # Create 3 past sessions and the current active session, looking up
+        # existing ones by date in one query and inserting the rest in one batch
+        # The dates and their month labels are computed once, by index from today,
+        # and shared by the lookup, the new rows, and their names
+        today = timezone.now().date()
+        session_dates = [today - i * SESSION_INTERVAL for i in range(3, 0, -1)] + [today]
+        month_labels = [session_date.strftime("%B %Y") for session_date in session_dates]
+        sessions_by_date, existing_dates = bulk_get_or_create(
+            Session.objects.filter(date__in=session_dates),
+            [
+                Session(
+                    name=f'Monthly Health Check {month}',
+                    description=(
+                        f'Current monthly health check session for {month}'
+                        if session_date == today else
+                        f'Monthly health check session for {month}'
+                    ),
+                    date=session_date,
+                    is_active=session_date == today
+                )
+                for session_date, month in zip(session_dates, month_labels)
+            ],
+            key=lambda session: session.date
         )
-        sessions.append(current_session)
-        action = 'Created' if created else 'Found existing'
-        self.stdout.write(f'{action} current active session: {current_session_name}')
+        sessions = [sessions_by_date[session_date] for session_date in session_dates]
+        current_session = sessions[-1]
+        if verbose:
+            for session in sessions[:-1]:
+                action = 'Found existing' if session.date in existing_dates else 'Created'
+                self.stdout.write(f'{action} past session: {session.name}')
+        action = 'Found existing' if today in existing_dates else 'Created'
+        self.stdout.write(f'{action} current active session: {current_session.name}')
         
         # Ensure current session is active (even if it already existed)
-        if not created:
+        if today in existing_dates:
+            Session.objects.filter(pk=current_session.pk).update(is_active=True)
             current_session.is_active = True
-            current_session.save()
-            self.stdout.write(f'Updated session {current_session_name} to be active')
+            self.stdout.write(f'Updated session {current_session.name} to be active')
+        # bulk_create and update() send no post_save, so drop the cached active
+        # sessions directly; no per-session signal dispatch is needed
+        invalidate_cache_keys(ACTIVE_SESSIONS_CACHE_KEY, CURRENT_SESSION_CACHE_KEY)
         
         # Create users for each team
         default_password = make_password('password123')
@@ -200,93 +353,155 @@ class Command(BaseCommand):
         action = 'Created' if created else 'Found existing'
         self.stdout.write(f'{action} senior manager: seniormanager@example.com')
         
-        # Create department leaders
+        # Look up existing usernames once so reruns skip them without a query per user
+        existing_usernames = set(User.objects.values_list('username', flat=True))
+        new_users = []
+        engineer_usernames = []
+        
+        def add_user(username, **fields):
+            """Queue a user for creation unless the username is already taken."""
+            if username not in existing_usernames:
+                existing_usernames.add(username)
+                new_users.append(User(
+                    username=username,
+                    email=f'{username}@example.com',
+                    password=default_password,
+                    **fields
+                ))
+        
+        # Department leaders
         for dept in departments:
             username = f"deptleader_{dept.name.lower().replace(' ', '')}"
-            dept_leader, created = User.objects.get_or_create(
-                username=username,
-                defaults={
-                    'email': f'{username}@example.com',
-                    'password': default_password,
-                    'role': 'department_leader',
-                    'department': dept,
-                    'first_name': f'{dept.name}',
-                    'last_name': 'Leader'
-                }
+            add_user(
+                username,
+                role='department_leader',
+                department=dept,
+                first_name=f'{dept.name}',
+                last_name='Leader'
             )
-            action = 'Created' if created else 'Found existing'
-            self.stdout.write(f'{action} department leader: {username}@example.com')
         
-        # Create team leaders and engineers
-        for team in teams:
+        # Team leaders and engineers (3-5 per team)
+        engineer_counts = rng.integers(3, 6, size=len(teams)).tolist()
+        for team, num_engineers in zip(teams, engineer_counts):
+            # Normalize the team name once for all of the team's usernames
+            team_slug = team.name.lower().replace(' ', '')
+            
             # Team leader
-            team_leader_username = f"teamleader_{team.name.lower().replace(' ', '')}"
-            team_leader, created = User.objects.get_or_create(
-                username=team_leader_username[:30],  # Ensure username is not too long
-                defaults={
-                    'email': f'{team_leader_username[:30]}@example.com',
-                    'password': default_password,
-                    'role': 'team_leader',
-                    'department': team.department,
-                    'team': team,
-                    'first_name': f'{team.name}',
-                    'last_name': 'Leader'
-                }
+            add_user(
+                f"teamleader_{team_slug}"[:30],  # Ensure username is not too long
+                role='team_leader',
+                department_id=team.department_id,
+                team=team,
+                first_name=f'{team.name}',
+                last_name='Leader'
             )
-            action = 'Created' if created else 'Found existing'
-            self.stdout.write(f'{action} team leader: {team_leader_username[:30]}@example.com')
             
-            # Engineers (3-5 per team)
-            num_engineers = random.randint(3, 5)
+            # Engineers
             for i in range(1, num_engineers + 1):
-                eng_username = f"engineer_{team.name.lower().replace(' ', '')}_{i}"
-                engineer, created = User.objects.get_or_create(
-                    username=eng_username[:30],  # Ensure username is not too long
-                    defaults={
-                        'email': f'{eng_username[:30]}@example.com',
-                        'password': default_password,
-                        'role': 'engineer',
-                        'department': team.department,
-                        'team': team,
-                        'first_name': f'Engineer {i}',
-                        'last_name': f'Team {team.name}'
-                    }
+                eng_username = f"engineer_{team_slug}_{i}"[:30]  # Ensure username is not too long
+                engineer_usernames.append(eng_username)
+                add_user(
+                    eng_username,
+                    role='engineer',
+                    department_id=team.department_id,
+                    team=team,
+                    first_name=f'Engineer {i}',
+                    last_name=f'Team {team.name}'
                 )
-                action = 'Created' if created else 'Found existing'
-                self.stdout.write(f'{action} engineer: {eng_username[:30]}@example.com')
+        
+        # Write all new users in batched multi-row inserts
+        User.objects.bulk_create(new_users, batch_size=USER_BATCH_SIZE, ignore_conflicts=True)
+        self.stdout.write(f'Created {len(new_users)} department leaders, team leaders, and engineers')
+        
+        # Reload the engineers' primary keys for the votes below; the vote loop
+        # reads nothing else from the user, so no rows or joins are loaded.
+        # Ordered by id so the vote slots line up the same way on every run
+        engineer_ids = list(
+            User.objects.filter(username__in=engineer_usernames)
+            .order_by('id')
+            .values_list('id', flat=True)
+        )
+        
+        # Look up existing votes once so reruns skip them without a query per vote
+        existing_votes = set(
+            Vote.objects.filter(session__in=sessions, card__in=cards)
+            .values_list('user_id', 'session_id', 'card_id')
+        )
+        votes_created = 0
+        
+        # Draw every random value for the vote loop up front in vectorized calls.
+        # Each engineer, session, and card combination is a slot; about 30% of the
+        # slots are skipped to simulate incomplete data. The kept slots are selected
+        # in one call and split back into engineer, session, and card positions, so
+        # the loop below only visits votes that may be written. Choices are drawn
+        # from object arrays, so each column is sampled and mapped to its Python
+        # strings in C rather than with a per-vote lookup
+        slot_shape = (len(engineer_ids), len(sessions), len(cards))
+        num_slots = len(engineer_ids) * len(sessions) * len(cards)
+        kept_slots = np.flatnonzero(rng.random(num_slots) <= 0.7)
+        num_votes = len(kept_slots)
+        engineer_idx, session_idx, card_idx = np.unravel_index(kept_slots, slot_shape)
+        vote_values = rng.choice(np.array(VOTE_VALUES, dtype=object), size=num_votes).tolist()
+        progress_notes = rng.choice(np.array(PROGRESS_NOTES, dtype=object), size=num_votes).tolist()
+        # Half of the votes carry their card's sample comment. The comment options
+        # are laid out flat as ('', comment) per card, so card position * 2 plus
+        # the drawn flag indexes a vote's comment directly
+        card_comments = np.array(
+            [option for card in cards for option in ('', f'Automated sample comment for {card.name}')],
+            dtype=object
+        )
+        comments = card_comments[card_idx * 2 + (rng.random(num_votes) > 0.5)].tolist()
+        # Votes are timestamped during working hours (8:00-18:00) on their session's
+        # day. Each session's midnight is converted to epoch seconds once, so every
+        # vote's timestamp is one array addition instead of aware datetime arithmetic
+        session_starts = np.array(
+            [timezone.make_aware(datetime.combine(session.date, time.min)).timestamp() for session in sessions],
+            dtype=np.int64
+        )
+        vote_times = (
+            session_starts[session_idx] + rng.integers(8 * 3600, 18 * 3600, size=num_votes)
+        ).tolist()
+        # Map every kept slot's positions to primary keys in one indexing call per
+        # column, so the loop below does no per-vote list or attribute lookups
+        vote_engineer_ids = np.array(engineer_ids, dtype=np.int64)[engineer_idx].tolist()
+        vote_session_ids = np.array([session.id for session in sessions], dtype=np.int64)[session_idx].tolist()
+        vote_card_ids = np.array([card.id for card in cards], dtype=np.int64)[card_idx].tolist()
+        
+        def vote_rows():
+            """Yield the rows for the kept slots, in engineer, session, card order."""
+            for engineer_id, session_id, card_id, value, progress_note, comment, vote_time in zip(
+                vote_engineer_ids, vote_session_ids, vote_card_ids,
+                vote_values, progress_notes, comments, vote_times
+            ):
+                if (engineer_id, session_id, card_id) in existing_votes:
+                    continue
                 
-                # Create votes for past sessions
-                for session in sessions:
-                    for card in cards:
-                        # Skip some votes randomly to simulate incomplete data
-                        if random.random() > 0.7:
-                            continue
-                            
-                        vote_value = random.choice(['green', 'amber', 'red'])
-                        progress = random.choice(['better', 'same', 'worse'])
-                        
-                        vote, vote_created = Vote.objects.get_or_create(
-                            user=engineer,
-                            session=session,
-                            card=card,
-                            defaults={
-                                'value': vote_value,
-                                'progress_note': progress,
-                                'comment': f'Automated sample comment for {card.name}' if random.random() > 0.5 else ''
-                            }
-                        )
-                        
-                        if vote_created:
-                            self.stdout.write(f'Created vote for {engineer.username} on {card.name} in {session.name}')
+                yield (
+                    engineer_id,
+                    session_id,
+                    card_id,
+                    value,
+                    progress_note,
+                    comment,
+                    datetime.fromtimestamp(vote_time, tz=dt_timezone.utc)
+                )
+        
+        # Rows are built lazily and consumed one batch at a time, so at most one
+        # batch of vote tuples is held in memory however large the run is
+        rows = vote_rows()
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            insert_votes(batch, batch_size)
+            votes_created += len(batch)
+            if len(batch) == batch_size:
+                self.stdout.write(f'Created {votes_created} votes so far...')
+        self.stdout.write(f'Created {votes_created} votes')
         
-        # Update team and department summaries
-        for session in sessions:
-            for card in cards:
-                for team in teams:
-                    # Update team summary
-                    from core.views import update_team_summary
-                    update_team_summary(team, session, card)
-                    self.stdout.write(f'Updated team summary for {team.name} on {card.name} in {session.name}')
+        # Update team and department summaries with one grouped aggregate per level
+        team_count, department_count = rebuild_summaries(sessions, cards)
+        self.stdout.write(f'Updated {team_count} team summaries and {department_count} department summaries')
         
         # Complete message
         self.stdout.write(self.style.SUCCESS('Successfully created all sample data!'))
@@ -299,6 +514,7 @@ class Command(BaseCommand):
         self.stdout.write('  Team Leaders: username=teamleader_<teamname>, password=password123')
         self.stdout.write('  Engineers: username=engineer_<teamname>_<number>, password=password123')
         self.stdout.write('\nExample users:')
+        example_team_slug = teams[0].name.lower().replace(" ", "")[:20]
         self.stdout.write(f'  Department Leader: username=deptleader_{departments[0].name.lower().replace(" ", "")}, password=password123')
-        self.stdout.write(f'  Team Leader: username=teamleader_{teams[0].name.lower().replace(" ", "")[:20]}, password=password123')
-        self.stdout.write(f'  Engineer: username=engineer_{teams[0].name.lower().replace(" ", "")[:20]}_1, password=password123')
+        self.stdout.write(f'  Team Leader: username=teamleader_{example_team_slug}, password=password123')
+        self.stdout.write(f'  Engineer: username=engineer_{example_team_slug}_1, password=password123')
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0002_department_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(
+                fields=["is_active", "date"], name="session_active_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="teamsummary",
+            index=models.Index(
+                fields=["team", "session"], name="teamsummary_team_session_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vote",
+            index=models.Index(
+                fields=["user", "session"], name="vote_user_session_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vote",
+            index=models.Index(
+                fields=["session", "card"], name="vote_session_card_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Trigram indexes backing the admin's case-insensitive name search.
+# PostgreSQL only; other backends keep using the plain column.
+
+from django.db import migrations
+
+# Django's icontains lookup on PostgreSQL compiles to UPPER(col::text) LIKE UPPER(%s),
+# so the indexes are built on that expression for the planner to use them
+TRIGRAM_INDEXES = (
+    ("core_department_name_trgm", "core_department"),
+    ("core_team_name_trgm", "core_team"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" '
+            f'ON "{table}" USING gin ((UPPER("name"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name, _table in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0003_vote_session_teamsummary_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
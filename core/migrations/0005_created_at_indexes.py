@@ -0,0 +1,73 @@
+# Indexes on created_at backing the admin date hierarchy on Vote and the summary tables.
+# On PostgreSQL they are built with CREATE INDEX CONCURRENTLY so the write-heavy tables
+# stay writable during the build; other backends use a regular CREATE INDEX.
+
+from django.db import migrations, models
+
+CREATED_AT_INDEXES = (
+    ("vote", "vote_created_at_idx"),
+    ("teamsummary", "teamsummary_created_at_idx"),
+    ("departmentsummary", "deptsummary_created_at_idx"),
+)
+
+
+def create_created_at_indexes(apps, schema_editor):
+    for model_name, index_name in CREATED_AT_INDEXES:
+        model = apps.get_model("core", model_name)
+        index = models.Index(fields=["created_at"], name=index_name)
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{index_name}" '
+                f'ON "{model._meta.db_table}" ("created_at")'
+            )
+        else:
+            schema_editor.add_index(model, index)
+
+
+def drop_created_at_indexes(apps, schema_editor):
+    for model_name, index_name in CREATED_AT_INDEXES:
+        model = apps.get_model("core", model_name)
+        index = models.Index(fields=["created_at"], name=index_name)
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{index_name}"')
+        else:
+            schema_editor.remove_index(model, index)
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("core", "0004_name_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(
+                    create_created_at_indexes, drop_created_at_indexes
+                ),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="vote",
+                    index=models.Index(
+                        fields=["created_at"], name="vote_created_at_idx"
+                    ),
+                ),
+                migrations.AddIndex(
+                    model_name="teamsummary",
+                    index=models.Index(
+                        fields=["created_at"], name="teamsummary_created_at_idx"
+                    ),
+                ),
+                migrations.AddIndex(
+                    model_name="departmentsummary",
+                    index=models.Index(
+                        fields=["created_at"], name="deptsummary_created_at_idx"
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0005_created_at_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="session",
+            name="session_active_date_idx",
+        ),
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-date"],
+                name="session_active_date_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:03
+
+from django.db import migrations, models
+
+# Mirrors Vote.VALUE_SCORES at the time of this migration
+VALUE_SCORES = {"green": 3, "amber": 2, "red": 1}
+
+
+def populate_vote_scores(apps, schema_editor):
+    # One UPDATE ... CASE over the table rather than a save per vote
+    Vote = apps.get_model("core", "Vote")
+    Vote.objects.update(
+        score=models.Case(
+            *[models.When(value=value, then=score) for value, score in VALUE_SCORES.items()],
+            default=0,
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0006_active_session_partial_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="vote",
+            name="score",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_vote_scores, migrations.RunPython.noop),
+    ]
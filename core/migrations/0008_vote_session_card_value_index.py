@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0007_vote_score"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="vote",
+            name="vote_session_card_idx",
+        ),
+        migrations.AddIndex(
+            model_name="vote",
+            index=models.Index(
+                fields=["session", "card", "value"], name="vote_session_card_value_idx"
+            ),
+        ),
+    ]
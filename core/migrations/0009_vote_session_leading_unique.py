@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0008_vote_session_card_value_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="vote",
+            name="vote_user_session_idx",
+        ),
+        migrations.AlterUniqueTogether(
+            name="vote",
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name="vote",
+            index=models.Index(fields=["user", "card"], name="vote_user_card_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="vote",
+            constraint=models.UniqueConstraint(
+                fields=("session", "user", "card"), name="vote_session_user_card_uniq"
+            ),
+        ),
+    ]
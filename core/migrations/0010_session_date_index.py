@@ -0,0 +1,16 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0009_vote_session_leading_unique"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(fields=["date"], name="session_date_idx"),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:17
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0010_session_date_index"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="departmentsummary",
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name="teamsummary",
+            options={},
+        ),
+    ]
@@ -17,11 +17,39 @@ Key components:
 The models implement various methods for calculating trends, permissions, and aggregated statistics.
 """
 
-from django.db import models
+from collections import defaultdict
+
+from django.db import connection, models
+from django.db.models.functions import Coalesce, Lag
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 
+# Cache key and lifetime for the id of the most recent active session; the
+# entry is dropped by the Session signal handlers whenever a session changes
+CURRENT_SESSION_CACHE_KEY = 'models:current_session_id'
+CURRENT_SESSION_CACHE_TIMEOUT = 60
+
+
+def get_current_session_id():
+    """
+    Return the id of the most recent active session, served from cache.
+    
+    Dashboards call the per-user, per-team, and per-department "recent" helpers
+    many times per request, and each needs the same session. Only the id is
+    cached, so callers filter on session_id without loading the Session row.
+    
+    Returns:
+        Integer session id, or None if no session is active
+    """
+    return cache.get_or_set(
+        CURRENT_SESSION_CACHE_KEY,
+        lambda: Session.objects.filter(is_active=True).order_by('-date').values_list('id', flat=True).first(),
+        CURRENT_SESSION_CACHE_TIMEOUT,
+    )
+
+
 class User(AbstractUser):
     """
     Extended User model that inherits from Django's AbstractUser.
@@ -50,6 +78,10 @@ class User(AbstractUser):
         ('senior_manager', 'Senior Manager'),  # Can view all departments and organization-wide data
         ('admin', 'Admin'),  # Has full system access
     )
+    # Role value -> label, so __str__ skips the per-call choices scan
+    ROLE_DISPLAY = dict(ROLES)
+    # Roles with organization-wide access to teams and departments
+    PRIVILEGED_ROLES = frozenset({'admin', 'senior_manager'})
     # User's role in the organization - determines permissions and access levels
     role = models.CharField(max_length=20, choices=ROLES)
     
@@ -106,7 +138,7 @@ class User(AbstractUser):
         Returns:
             String with username and display version of role
         """
-        return f"{self.username} ({self.get_role_display()})"
+        return f"{self.username} ({self.ROLE_DISPLAY.get(self.role, self.role)})"
     
     def get_recent_votes(self):
         """
@@ -120,13 +152,40 @@ class User(AbstractUser):
             QuerySet of Vote objects or empty QuerySet if no active session exists
         """
         # Find the most recent active session
-        recent_session = Session.objects.filter(is_active=True).order_by('-date').first()
-        if recent_session:
+        recent_session_id = get_current_session_id()
+        if recent_session_id is not None:
             # Return all votes by this user in that session
-            return Vote.objects.filter(user=self, session=recent_session)
+            return Vote.objects.filter(user=self, session_id=recent_session_id)
         # Return empty QuerySet if no active session exists
         return Vote.objects.none()
     
+    @classmethod
+    def recent_votes_for(cls, users, session=None):
+        """
+        Return the votes of many users in one session, grouped by user id.
+        
+        The batch counterpart of get_recent_votes for pages that list many
+        users: one query (with each vote's card joined) replaces a query per
+        user. Look users up with .get(user.pk, []) since users without votes
+        have no entry.
+        
+        Args:
+            users: QuerySet or iterable of User objects
+            session: Session object to read votes from; defaults to the most
+                recent active session
+            
+        Returns:
+            Dictionary mapping user id to a list of Vote objects, empty if no
+            session is given or active
+        """
+        session_id = session.pk if session is not None else get_current_session_id()
+        if session_id is None:
+            return {}
+        votes_by_user = defaultdict(list)
+        for vote in Vote.objects.filter(session_id=session_id, user__in=users).select_related('card'):
+            votes_by_user[vote.user_id].append(vote)
+        return dict(votes_by_user)
+    
     def has_voted_in_session(self, session):
         """
         Check if user has submitted any votes in a specific session.
@@ -135,13 +194,60 @@ class User(AbstractUser):
         haven't yet contributed to a health check session. Used in team
         detail views and participation reports.
         
+        For many users at once use annotate_voted instead. This single-user
+        check runs a plain SELECT 1 ... LIMIT 1 on the cursor, skipping
+        queryset construction and SQL compilation on every call.
+        
         Args:
             session: Session object to check for votes
             
         Returns:
             Boolean indicating whether the user has voted in the session
         """
-        return Vote.objects.filter(user=self, session=session).exists()
+        quote_name = connection.ops.quote_name
+        opts = Vote._meta
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT 1 FROM {quote_name(opts.db_table)} "
+                f"WHERE {quote_name(opts.get_field('user').column)} = %s "
+                f"AND {quote_name(opts.get_field('session').column)} = %s LIMIT 1",
+                [self.pk, session.pk],
+            )
+            return cursor.fetchone() is not None
+    
+    @classmethod
+    def annotate_voted(cls, queryset, session):
+        """
+        Annotate a user queryset with whether each user has voted in a session.
+        
+        The batch counterpart of has_voted_in_session for views and reports
+        that list many users: the check becomes a correlated EXISTS subquery
+        in the same SELECT, instead of one query per user. Filter on
+        voted=False to find users who have not participated.
+        
+        Args:
+            queryset: QuerySet of User objects to annotate
+            session: Session object to check for votes, or None
+            
+        Returns:
+            QuerySet whose users carry a boolean 'voted' attribute; always False
+            when no session is given
+        """
+        if session is None:
+            return queryset.annotate(voted=models.Value(False, output_field=models.BooleanField()))
+        return queryset.annotate(
+            voted=models.Exists(Vote.objects.filter(user=models.OuterRef('pk'), session=session))
+        )
+    
+    @property
+    def is_privileged(self):
+        """
+        Whether the user's role grants access to every team and department.
+        
+        Returns:
+            Boolean indicating whether the role is in PRIVILEGED_ROLES
+        """
+        return self.role in self.PRIVILEGED_ROLES
     
     def can_manage_team(self, team):
         """
@@ -163,13 +269,14 @@ class User(AbstractUser):
             Boolean indicating whether the user can manage the team
         """
         # Admins and senior managers can manage any team
-        if self.role == 'admin' or self.role == 'senior_manager':
+        if self.role in self.PRIVILEGED_ROLES:
             return True
-        # Department leaders can manage teams in their department
-        if self.role == 'department_leader' and team.department == self.department:
+        # Department leaders can manage teams in their department; compare
+        # foreign key ids so neither department row is loaded
+        if self.role == 'department_leader' and team.department_id == self.department_id:
             return True
         # Team leaders can only manage their own team
-        if self.role == 'team_leader' and team == self.team:
+        if self.role == 'team_leader' and self.team_id is not None and team.pk == self.team_id:
             return True
         # All other roles (engineers) cannot manage teams
         return False
@@ -193,10 +300,11 @@ class User(AbstractUser):
             Boolean indicating whether the user can view the department summary
         """
         # Admins and senior managers can view any department
-        if self.role == 'admin' or self.role == 'senior_manager':
+        if self.role in self.PRIVILEGED_ROLES:
             return True
         # Department leaders can only view their own department
-        if self.role == 'department_leader' and department == self.department:
+        if (self.role == 'department_leader' and self.department_id is not None
+                and department.pk == self.department_id):
             return True
         # All other roles cannot view department summaries
         return False
@@ -242,18 +350,23 @@ class Department(models.Model):
         Returns:
             QuerySet of Team objects belonging to this department
         """
-        return Team.objects.filter(department=self)
+        return self.team_set.all()
     
     def get_team_count(self):
         """
         Count the number of teams in this department.
         
         Used in department overview pages and for administrative reporting.
+        List pages annotate team_count on the queryset (Count('team')) so the
+        count comes from the same query; otherwise one COUNT is run.
         
         Returns:
             Integer count of teams in this department
         """
-        return self.get_teams().count()
+        team_count = getattr(self, 'team_count', None)
+        if team_count is not None:
+            return team_count
+        return self.team_set.count()
     
     def get_user_count(self):
         """
@@ -261,12 +374,16 @@ class Department(models.Model):
         
         This method counts all users who have this department assigned,
         regardless of their team assignment. Used in department overview
-        pages and administrative reporting.
+        pages and administrative reporting. Uses an annotated user_count when
+        the queryset provides one.
         
         Returns:
             Integer count of users in this department
         """
-        return User.objects.filter(department=self).count()
+        user_count = getattr(self, 'user_count', None)
+        if user_count is not None:
+            return user_count
+        return self.user_set.count()
     
     def get_recent_summaries(self):
         """
@@ -280,10 +397,10 @@ class Department(models.Model):
             QuerySet of DepartmentSummary objects or empty QuerySet if no active session
         """
         # Find the most recent active session
-        recent_session = Session.objects.filter(is_active=True).order_by('-date').first()
-        if recent_session:
+        recent_session_id = get_current_session_id()
+        if recent_session_id is not None:
             # Return all summaries for this department in that session
-            return DepartmentSummary.objects.filter(department=self, session=recent_session)
+            return DepartmentSummary.objects.filter(department=self, session_id=recent_session_id)
         # Return empty QuerySet if no active session exists
         return DepartmentSummary.objects.none()
 
@@ -324,11 +441,17 @@ class Team(models.Model):
         
         This method is used in team overview pages, department dashboards,
         and administrative reports to show team sizes and distribution.
+        Pages listing several teams annotate member_count on the queryset
+        (Count('user')) so the count comes from the same query; otherwise one
+        COUNT is run.
         
         Returns:
             Integer count of users assigned to this team
         """
-        return User.objects.filter(team=self).count()
+        member_count = getattr(self, 'member_count', None)
+        if member_count is not None:
+            return member_count
+        return self.user_set.count()
     
     def get_members(self):
         """
@@ -341,7 +464,7 @@ class Team(models.Model):
         Returns:
             QuerySet of User objects belonging to this team
         """
-        return User.objects.filter(team=self)
+        return self.user_set.all()
     
     def get_team_leaders(self):
         """
@@ -354,7 +477,44 @@ class Team(models.Model):
         Returns:
             QuerySet of User objects with team_leader role for this team
         """
-        return User.objects.filter(team=self, role='team_leader')
+        return self.user_set.filter(role='team_leader')
+    
+    @classmethod
+    def annotate_health_counts(cls, queryset):
+        """
+        Annotate a team queryset with its summary counts by color for the current session.
+        
+        TeamSummary rows are kept up to date as votes arrive, so a team's health
+        only needs its summaries counted. Pages that list many teams use this to
+        count them in the same SELECT (red/amber/green_summary_count), and
+        get_latest_health_status reads the annotations instead of running an
+        aggregate per team. Each count is a correlated subquery, so it can be
+        combined with other annotations such as member_count.
+        
+        Args:
+            queryset: QuerySet of Team objects to annotate
+            
+        Returns:
+            QuerySet whose teams carry red_summary_count, amber_summary_count and
+            green_summary_count; all zero when no session is active
+        """
+        session_id = get_current_session_id()
+        
+        def summary_count(color):
+            if session_id is None:
+                return models.Value(0, output_field=models.IntegerField())
+            summaries = TeamSummary.objects.filter(
+                team=models.OuterRef('pk'), session_id=session_id, average_vote=color
+            ).order_by().values('team').annotate(n=models.Count('id')).values('n')
+            return Coalesce(
+                models.Subquery(summaries, output_field=models.IntegerField()), 0
+            )
+        
+        return queryset.annotate(
+            red_summary_count=summary_count('red'),
+            amber_summary_count=summary_count('amber'),
+            green_summary_count=summary_count('green'),
+        )
     
     def get_latest_health_status(self):
         """
@@ -367,25 +527,35 @@ class Team(models.Model):
         
         This is used in dashboards and reports to provide a high-level view of
         team health without requiring detailed examination of individual metrics.
+        Teams from annotate_health_counts are decided without a query.
         
         Returns:
             String ('red', 'amber', or 'green') representing overall health status,
             or None if no data is available for the latest session
         """
-        # Find the most recent active session
-        latest_session = Session.objects.filter(is_active=True).order_by('-date').first()
-        if not latest_session:
-            return None
-        
-        # Get all team summaries for this team in the latest session
-        team_summaries = TeamSummary.objects.filter(team=self, session=latest_session)
-        if not team_summaries.exists():
-            return None
-        
-        # Count votes by color
-        red_count = team_summaries.filter(average_vote='red').count()
-        amber_count = team_summaries.filter(average_vote='amber').count()
-        green_count = team_summaries.filter(average_vote='green').count()
+        # Teams loaded through annotate_health_counts already carry the counts
+        if hasattr(self, 'green_summary_count'):
+            red_count = self.red_summary_count
+            amber_count = self.amber_summary_count
+            green_count = self.green_summary_count
+        else:
+            # Find the most recent active session
+            latest_session_id = get_current_session_id()
+            if latest_session_id is None:
+                return None
+            
+            # Count this team's summaries by color in one conditional aggregate;
+            # with no summaries every count is zero
+            counts = TeamSummary.objects.filter(
+                team=self, session_id=latest_session_id
+            ).aggregate(
+                red=models.Count('id', filter=models.Q(average_vote='red')),
+                amber=models.Count('id', filter=models.Q(average_vote='amber')),
+                green=models.Count('id', filter=models.Q(average_vote='green')),
+            )
+            red_count = counts['red']
+            amber_count = counts['amber']
+            green_count = counts['green']
         
         # Determine overall status based on which color has the highest count
         if red_count > amber_count and red_count > green_count:
@@ -441,8 +611,22 @@ class Session(models.Model):
         Meta options for the Session model.
         
         - ordering: Sessions are ordered by date in descending order (newest first)
+        - indexes: Backs the frequent "latest active session" lookup. The index is
+          partial, covering only active sessions, so it stays a handful of entries
+          however many closed sessions accumulate, and is read in date order
+          without a sort. A full date index serves the default ordering
+          (Session.objects.first() for the latest session of any status) and
+          the date range filters of the progress chart
         """
         ordering = ['-date']
+        indexes = [
+            models.Index(
+                fields=['-date'],
+                condition=models.Q(is_active=True),
+                name='session_active_date_idx',
+            ),
+            models.Index(fields=['date'], name='session_date_idx'),
+        ]
     
     def get_participation_rate(self, team=None):
         """
@@ -461,22 +645,19 @@ class Session(models.Model):
         Returns:
             Float representing percentage (0-100) of eligible users who have participated
         """
-        if team:
-            # Calculate participation rate for a specific team
-            eligible_users = User.objects.filter(team=team).count()
-            if eligible_users == 0:
-                return 0  # Avoid division by zero
-            # Count distinct users who have voted in this session from this team
-            participants = Vote.objects.filter(session=self, user__team=team).values('user').distinct().count()
-            return (participants / eligible_users) * 100
-        else:
-            # Calculate participation rate across all users
-            eligible_users = User.objects.all().count()
-            if eligible_users == 0:
-                return 0  # Avoid division by zero
-            # Count distinct users who have voted in this session
-            participants = Vote.objects.filter(session=self).values('user').distinct().count()
-            return (participants / eligible_users) * 100
+        # Eligible users are the team's members, or every user without a team filter
+        users = User.objects.filter(team=team) if team else User.objects.all()
+        # Count eligible users and those who voted in this session in one query.
+        # Participation is a per-user EXISTS (see User.annotate_voted), so each
+        # user stays one row and neither count needs a join to the votes or a
+        # DISTINCT over it
+        counts = User.annotate_voted(users, self).aggregate(
+            eligible=models.Count('id'),
+            participants=models.Count('id', filter=models.Q(voted=True)),
+        )
+        if counts['eligible'] == 0:
+            return 0  # Avoid division by zero
+        return (counts['participants'] / counts['eligible']) * 100
     
     def is_complete(self):
         """
@@ -493,12 +674,13 @@ class Session(models.Model):
         Returns:
             Boolean indicating whether all eligible users have participated
         """
-        # Only engineers and team leaders are expected to vote
-        eligible_users = User.objects.filter(role__in=['engineer', 'team_leader']).count()
-        # Count distinct users who have voted in this session
-        participants = Vote.objects.filter(session=self).values('user').distinct().count()
-        # Session is complete when all eligible users have participated
-        return eligible_users == participants
+        # Only engineers and team leaders are expected to vote; the session is
+        # complete when none of them is missing a vote. A single NOT EXISTS
+        # query stops at the first non-voter, and votes from other roles can
+        # no longer make up for missing ones as they could when comparing counts
+        return not User.objects.filter(role__in=['engineer', 'team_leader']).filter(
+            ~models.Exists(Vote.objects.filter(user=models.OuterRef('pk'), session=self))
+        ).exists()
 
 class HealthCheckCard(models.Model):
     """
@@ -571,22 +753,65 @@ class HealthCheckCard(models.Model):
         if session:
             votes = votes.filter(session=session)
         
-        # Count total votes
-        total = votes.count()
+        # Count the total and each color in a single conditional aggregate
+        counts = votes.aggregate(
+            total=models.Count('id'),
+            green=models.Count('id', filter=models.Q(value='green')),
+            amber=models.Count('id', filter=models.Q(value='amber')),
+            red=models.Count('id', filter=models.Q(value='red')),
+        )
+        return self._distribution_from_counts(counts)
+    
+    @classmethod
+    def get_vote_distributions(cls, session=None):
+        """
+        Calculate the vote distribution of every card in one grouped query.
+        
+        Dashboards that show a distribution per card would otherwise call
+        get_vote_distribution once per card; this groups the votes by card
+        instead and returns the same percentages for all of them at once.
+        
+        Args:
+            session: Optional Session object to filter votes by session
+            
+        Returns:
+            Dictionary mapping card id to a dictionary with keys 'green', 'amber',
+            'red' and percentage values (0-100); cards without votes are omitted
+        """
+        votes = Vote.objects.all()
+        if session:
+            votes = votes.filter(session=session)
+        
+        # order_by() clears the default ordering so it stays out of the grouping
+        rows = votes.values('card_id').annotate(
+            total=models.Count('id'),
+            green=models.Count('id', filter=models.Q(value='green')),
+            amber=models.Count('id', filter=models.Q(value='amber')),
+            red=models.Count('id', filter=models.Q(value='red')),
+        ).order_by()
+        return {row['card_id']: cls._distribution_from_counts(row) for row in rows}
+    
+    @staticmethod
+    def _distribution_from_counts(counts):
+        """
+        Convert vote counts into percentages.
+        
+        Args:
+            counts: Mapping with 'total', 'green', 'amber', and 'red' vote counts
+            
+        Returns:
+            Dictionary with keys 'green', 'amber', 'red' and percentage values (0-100)
+        """
+        total = counts['total']
         if total == 0:
             # Return zeros if no votes exist
             return {'green': 0, 'amber': 0, 'red': 0}
         
-        # Count votes by color
-        green = votes.filter(value='green').count()
-        amber = votes.filter(value='amber').count()
-        red = votes.filter(value='red').count()
-        
         # Calculate percentages
         return {
-            'green': (green / total) * 100,
-            'amber': (amber / total) * 100,
-            'red': (red / total) * 100
+            'green': (counts['green'] / total) * 100,
+            'amber': (counts['amber'] / total) * 100,
+            'red': (counts['red'] / total) * 100
         }
 
 class Vote(models.Model):
@@ -620,6 +845,9 @@ class Vote(models.Model):
         ('worse', 'Worse'),    # Deteriorating since last session
     )
     
+    # Numeric score per traffic light value; higher is healthier
+    VALUE_SCORES = {'green': 3, 'amber': 2, 'red': 1}
+    
     # User who submitted this vote
     # CASCADE ensures votes are deleted if the user is deleted
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -635,6 +863,10 @@ class Vote(models.Model):
     # The traffic light value selected by the user
     value = models.CharField(max_length=5, choices=VOTE_CHOICES)
     
+    # Numeric form of value (see VALUE_SCORES), kept in step on save so scores
+    # can be compared and aggregated in SQL; bulk writers must set it themselves
+    score = models.PositiveSmallIntegerField(default=0, editable=False)
+    
     # The user's assessment of progress since the last session
     progress_note = models.CharField(max_length=6, choices=PROGRESS_CHOICES)
     
@@ -649,11 +881,27 @@ class Vote(models.Model):
         """
         Meta options for the Vote model.
         
-        - unique_together: Ensures a user can only vote once per card per session
+        - constraints: Ensures a user can only vote once per card per session. The
+          unique index leads with session, so it also serves session-scoped
+          scans and the per-user-per-session lookups
         - ordering: Votes are ordered by creation time (newest first)
-        """
-        unique_together = ('user', 'card', 'session')
+        - indexes: Back a user's votes on a card across sessions (previous vote,
+          trends), the per-session-per-card lookups, and the created_at range
+          scans behind the admin date hierarchy. The session/card index also
+          carries value, so the per-card color counts of a session
+          (distributions, summaries) are read from the index alone
+        """
+        constraints = [
+            models.UniqueConstraint(
+                fields=['session', 'user', 'card'], name='vote_session_user_card_uniq'
+            ),
+        ]
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'card'], name='vote_user_card_idx'),
+            models.Index(fields=['session', 'card', 'value'], name='vote_session_card_value_idx'),
+            models.Index(fields=['created_at'], name='vote_created_at_idx'),
+        ]
     
     def __str__(self):
         """
@@ -664,6 +912,21 @@ class Vote(models.Model):
         """
         return f"{self.user.username} - {self.card.name} - {self.value}"
     
+    def save(self, *args, **kwargs):
+        """
+        Save the vote, deriving its numeric score from the traffic light value.
+        
+        Args:
+            *args: Positional arguments passed to Model.save
+            **kwargs: Keyword arguments passed to Model.save
+        """
+        self.score = self.VALUE_SCORES.get(self.value, 0)
+        # A partial save that writes the value must write its score too
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'value' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'score'}
+        super().save(*args, **kwargs)
+    
     def get_previous_vote(self):
         """
         Find the most recent previous vote by the same user for the same card.
@@ -675,18 +938,40 @@ class Vote(models.Model):
         Returns:
             Vote object from the previous session, or None if no previous vote exists
         """
-        # Get all previous sessions ordered by date (newest first)
-        previous_sessions = Session.objects.filter(date__lt=self.session.date).order_by('-date')
+        # Join to the session and take the vote from the latest earlier date in a
+        # single query; the (user, card) index narrows the scan to this user's
+        # votes on this card. Returns None if no previous vote exists
+        return Vote.objects.filter(
+            user_id=self.user_id,
+            card_id=self.card_id,
+            session__date__lt=self.session.date
+        ).select_related('session').order_by('-session__date').first()
+    
+    @classmethod
+    def annotate_previous_score(cls, queryset):
+        """
+        Annotate a vote queryset with the score of each vote's previous vote.
         
-        # Check each previous session for a matching vote
-        for prev_session in previous_sessions:
-            try:
-                return Vote.objects.get(user=self.user, card=self.card, session=prev_session)
-            except Vote.DoesNotExist:
-                continue
+        The batch counterpart of get_previous_vote for trend reports: a LAG
+        window over each user's votes on a card, ordered by session date, gives
+        every vote its predecessor's score in the same query, and has_improved
+        reads it instead of querying per vote. The window only sees the rows
+        the queryset selects, so it must include the earlier sessions being
+        compared against; the first vote of each user and card in it gets None.
         
-        # No previous vote found
-        return None
+        Args:
+            queryset: QuerySet of Vote objects to annotate
+            
+        Returns:
+            QuerySet whose votes carry a 'previous_score' attribute
+        """
+        return queryset.annotate(
+            previous_score=models.Window(
+                expression=Lag('score'),
+                partition_by=[models.F('user_id'), models.F('card_id')],
+                order_by=models.F('session__date').asc(),
+            )
+        )
     
     def has_improved(self):
         """
@@ -699,21 +984,23 @@ class Vote(models.Model):
         Used in progress tracking, trend analysis, and highlighting improvements
         or deteriorations in team health.
         
+        Votes loaded through annotate_previous_score are compared without a query.
+        
         Returns:
             Boolean indicating improvement, or None if no previous vote exists
         """
-        # Get the previous vote by this user for this card
-        previous_vote = self.get_previous_vote()
-        if not previous_vote:
+        if hasattr(self, 'previous_score'):
+            previous_score = self.previous_score
+        else:
+            # Get the previous vote by this user for this card
+            previous_vote = self.get_previous_vote()
+            previous_score = previous_vote.score if previous_vote else None
+        if previous_score is None:
             return None  # Can't determine improvement without a previous vote
         
-        # Convert vote values to numeric scores for comparison
-        # Higher numbers are better: green (3) > amber (2) > red (1)
-        score_map = {'green': 3, 'amber': 2, 'red': 1}
-        current_score = score_map.get(self.value)
-        previous_score = score_map.get(previous_vote.value)
-        
-        return current_score > previous_score
+        # Compare numeric scores; higher numbers are better: green (3) > amber (2) > red (1)
+        # The previous vote's score is stored, this vote's may not be saved yet
+        return self.VALUE_SCORES.get(self.value, 0) > previous_score
 
 
 class TeamSummary(models.Model):
@@ -758,10 +1045,18 @@ class TeamSummary(models.Model):
         Meta options for the TeamSummary model.
         
         - unique_together: Ensures each team has only one summary per card per session
-        - ordering: Summaries are ordered by session date, newest first
+        - indexes: Back filtering a team's summaries by session and the
+          created_at range scans behind the admin date hierarchy
+        
+        There is no default ordering: ordering by session date joins the session
+        table, so only the views that list summaries across sessions order by
+        -session__date explicitly.
         """
         unique_together = ('team', 'card', 'session')
-        ordering = ['-session__date']
+        indexes = [
+            models.Index(fields=['team', 'session'], name='teamsummary_team_session_idx'),
+            models.Index(fields=['created_at'], name='teamsummary_created_at_idx'),
+        ]
     
     def __str__(self):
         """
@@ -783,18 +1078,41 @@ class TeamSummary(models.Model):
         Returns:
             TeamSummary object from the previous session, or None if no previous summary exists
         """
-        # Get all previous sessions ordered by date (newest first)
-        previous_sessions = Session.objects.filter(date__lt=self.session.date).order_by('-date')
+        # Join to the session and take the summary from the latest earlier date in a
+        # single query; the (team, card, session) unique index narrows the scan
+        # to this team's summaries of this card. Returns None if none exists
+        return TeamSummary.objects.filter(
+            team_id=self.team_id,
+            card_id=self.card_id,
+            session__date__lt=self.session.date
+        ).select_related('session').order_by('-session__date').first()
+    
+    @classmethod
+    def annotate_trends(cls, queryset):
+        """
+        Annotate a summary queryset with the average vote of each summary's predecessor.
         
-        # Check each previous session for a matching summary
-        for prev_session in previous_sessions:
-            try:
-                return TeamSummary.objects.get(team=self.team, card=self.card, session=prev_session)
-            except TeamSummary.DoesNotExist:
-                continue
+        The batch counterpart of get_previous_summary for trend reports: a LAG
+        window over each team's summaries of a card, ordered by session date,
+        gives every summary the previous average vote in the same query, and
+        calculate_trend reads it instead of querying per summary. The window
+        only sees the rows the queryset selects, so it must include the earlier
+        sessions being compared against.
         
-        # No previous summary found
-        return None
+        Args:
+            queryset: QuerySet of TeamSummary objects to annotate
+            
+        Returns:
+            QuerySet whose summaries carry a 'previous_average_vote' attribute,
+            None for the first summary of each team and card
+        """
+        return queryset.annotate(
+            previous_average_vote=models.Window(
+                expression=Lag('average_vote'),
+                partition_by=[models.F('team_id'), models.F('card_id')],
+                order_by=models.F('session__date').asc(),
+            )
+        )
     
     def calculate_trend(self):
         """
@@ -807,20 +1125,26 @@ class TeamSummary(models.Model):
         Used in dashboards, reports, and visualizations to highlight trends and
         changes in team health over time.
         
+        Summaries loaded through annotate_trends are compared without a query.
+        
         Returns:
             String ('improving', 'declining', or 'stable') indicating the trend,
             or None if no previous summary exists
         """
-        # Get the previous summary for this team and card
-        previous_summary = self.get_previous_summary()
-        if not previous_summary:
+        if hasattr(self, 'previous_average_vote'):
+            previous_vote = self.previous_average_vote
+        else:
+            # Get the previous summary for this team and card
+            previous_summary = self.get_previous_summary()
+            previous_vote = previous_summary.average_vote if previous_summary else None
+        if previous_vote is None:
             return None  # Can't determine trend without a previous summary
         
-        # Convert vote values to numeric scores for comparison
+        # Convert vote values to numeric scores for comparison, using the shared
+        # Vote.VALUE_SCORES table rather than building a dict on every call
         # Higher numbers are better: green (3) > amber (2) > red (1)
-        score_map = {'green': 3, 'amber': 2, 'red': 1}
-        current_score = score_map.get(self.average_vote)
-        previous_score = score_map.get(previous_summary.average_vote)
+        current_score = Vote.VALUE_SCORES.get(self.average_vote)
+        previous_score = Vote.VALUE_SCORES.get(previous_vote)
         
         # Determine trend based on score comparison
         if current_score > previous_score:
@@ -845,19 +1169,9 @@ class DepartmentSummary(models.Model):
     This model is used in dashboards, reports, and trend analysis to track department health
     over time, identify areas that need attention, and compare health across departments.
     """
-    # Traffic light voting system choices (same as Vote model)
-    VOTE_CHOICES = (
-        ('green', 'Green'),  # Good/healthy status
-        ('amber', 'Amber'),  # Caution/moderate issues
-        ('red', 'Red'),      # Poor/critical issues
-    )
-    
-    # Progress tracking choices (same as Vote model)
-    PROGRESS_CHOICES = (
-        ('better', 'Better'),  # Improving since last session
-        ('same', 'Same'),      # No change since last session
-        ('worse', 'Worse'),    # Deteriorating since last session
-    )
+    # Reference the same choices as Vote model for consistency
+    VOTE_CHOICES = Vote.VOTE_CHOICES
+    PROGRESS_CHOICES = Vote.PROGRESS_CHOICES
     
     # The department this summary is for
     # CASCADE ensures summaries are deleted if the department is deleted
@@ -892,10 +1206,15 @@ class DepartmentSummary(models.Model):
         Meta options for the DepartmentSummary model.
         
         - unique_together: Ensures only one summary per department, card, and session combination
-        - ordering: Summaries are ordered by session date (newest first)
+        - indexes: Back the created_at range scans behind the admin date hierarchy
+        
+        As with TeamSummary there is no default ordering, which would join the
+        session table on every query; listings order by -session__date explicitly.
         """
         unique_together = ('department', 'card', 'session')
-        ordering = ['-session__date']
+        indexes = [
+            models.Index(fields=['created_at'], name='deptsummary_created_at_idx'),
+        ]
     
     def __str__(self):
         """
@@ -917,18 +1236,41 @@ class DepartmentSummary(models.Model):
         Returns:
             DepartmentSummary object from the previous session, or None if no previous summary exists
         """
-        # Get all previous sessions ordered by date (newest first)
-        previous_sessions = Session.objects.filter(date__lt=self.session.date).order_by('-date')
+        # Join to the session and take the summary from the latest earlier date in a
+        # single query; the (department, card, session) unique index narrows the scan
+        # to this department's summaries of this card. Returns None if none exists
+        return DepartmentSummary.objects.filter(
+            department_id=self.department_id,
+            card_id=self.card_id,
+            session__date__lt=self.session.date
+        ).select_related('session').order_by('-session__date').first()
+    
+    @classmethod
+    def annotate_trends(cls, queryset):
+        """
+        Annotate a summary queryset with the average vote of each summary's predecessor.
         
-        # Check each previous session for a matching summary
-        for prev_session in previous_sessions:
-            try:
-                return DepartmentSummary.objects.get(department=self.department, card=self.card, session=prev_session)
-            except DepartmentSummary.DoesNotExist:
-                continue
+        The batch counterpart of get_previous_summary for trend reports: a LAG
+        window over each department's summaries of a card, ordered by session date,
+        gives every summary the previous average vote in the same query, and
+        calculate_trend reads it instead of querying per summary. The window
+        only sees the rows the queryset selects, so it must include the earlier
+        sessions being compared against.
         
-        # No previous summary found
-        return None
+        Args:
+            queryset: QuerySet of DepartmentSummary objects to annotate
+            
+        Returns:
+            QuerySet whose summaries carry a 'previous_average_vote' attribute,
+            None for the first summary of each department and card
+        """
+        return queryset.annotate(
+            previous_average_vote=models.Window(
+                expression=Lag('average_vote'),
+                partition_by=[models.F('department_id'), models.F('card_id')],
+                order_by=models.F('session__date').asc(),
+            )
+        )
     
     def calculate_trend(self):
         """
@@ -941,20 +1283,26 @@ class DepartmentSummary(models.Model):
         Used in dashboards, reports, and visualizations to highlight trends and
         changes in department health over time.
         
+        Summaries loaded through annotate_trends are compared without a query.
+        
         Returns:
             String ('improving', 'declining', or 'stable') indicating the trend,
             or None if no previous summary exists
         """
-        # Get the previous summary for this department and card
-        previous_summary = self.get_previous_summary()
-        if not previous_summary:
+        if hasattr(self, 'previous_average_vote'):
+            previous_vote = self.previous_average_vote
+        else:
+            # Get the previous summary for this department and card
+            previous_summary = self.get_previous_summary()
+            previous_vote = previous_summary.average_vote if previous_summary else None
+        if previous_vote is None:
             return None  # Can't determine trend without a previous summary
         
-        # Convert vote values to numeric scores for comparison
+        # Convert vote values to numeric scores for comparison, using the shared
+        # Vote.VALUE_SCORES table rather than building a dict on every call
         # Higher numbers are better: green (3) > amber (2) > red (1)
-        score_map = {'green': 3, 'amber': 2, 'red': 1}
-        current_score = score_map.get(self.average_vote)
-        previous_score = score_map.get(previous_summary.average_vote)
+        current_score = Vote.VALUE_SCORES.get(self.average_vote)
+        previous_score = Vote.VALUE_SCORES.get(previous_vote)
         
         # Determine trend based on score comparison
         if current_score > previous_score:
@@ -0,0 +1,108 @@
+"""
+Signal handlers for the Health Check System.
+
+These receivers keep cached API payloads consistent with the database by
+dropping the relevant cache entries whenever the underlying rows change.
+Bulk writers such as the sample data commands can defer the invalidations
+and apply them in one batch once their transaction commits.
+"""
+
+import threading
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .api.views import ACTIVE_SESSIONS_CACHE_KEY
+from .forms import team_ids_cache_key
+from .models import CURRENT_SESSION_CACHE_KEY, Session, Team
+
+# Per-thread set of cache keys awaiting deletion while invalidation is deferred
+_deferred = threading.local()
+
+
+def invalidate_cache_keys(*keys):
+    """
+    Delete cache entries now, or queue them while invalidation is deferred.
+
+    Bulk operations that bypass model signals (bulk_create, update) call this
+    directly for the keys their writes make stale.
+
+    Args:
+        *keys: Cache keys to drop
+    """
+    pending = getattr(_deferred, 'keys', None)
+    if pending is None:
+        cache.delete_many(keys)
+    else:
+        pending.update(keys)
+
+
+@contextmanager
+def deferred_cache_invalidation():
+    """
+    Collect cache invalidations and apply them once, after the transaction commits.
+
+    Seeding data saves many rows in one transaction; without this every saved
+    session or team would issue its own cache delete. Nested uses share the
+    outermost collection.
+    """
+    if getattr(_deferred, 'keys', None) is not None:
+        yield
+        return
+    _deferred.keys = set()
+    try:
+        yield
+    finally:
+        keys = list(_deferred.keys)
+        _deferred.keys = None
+        if keys:
+            transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+@receiver(post_save, sender=Session)
+@receiver(post_delete, sender=Session)
+def invalidate_active_sessions(sender, **kwargs):
+    """
+    Drop the cached active-session payload and current session id when any session changes.
+
+    Args:
+        sender: The Session model class
+        **kwargs: Signal arguments (instance, created, etc.)
+    """
+    invalidate_cache_keys(ACTIVE_SESSIONS_CACHE_KEY, CURRENT_SESSION_CACHE_KEY)
+
+
+@receiver(pre_save, sender=Team)
+def invalidate_previous_department_teams(sender, instance, **kwargs):
+    """
+    Drop the cached team ids of the department a team is being moved out of.
+
+    Args:
+        sender: The Team model class
+        instance: Team being saved
+        **kwargs: Signal arguments
+    """
+    if instance.pk is None:
+        return
+    previous_department_id = (
+        Team.objects.filter(pk=instance.pk).values_list('department_id', flat=True).first()
+    )
+    if previous_department_id is not None and previous_department_id != instance.department_id:
+        invalidate_cache_keys(team_ids_cache_key(previous_department_id))
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def invalidate_department_teams(sender, instance, **kwargs):
+    """
+    Drop the cached team ids of the team's department when the team changes.
+
+    Args:
+        sender: The Team model class
+        instance: Team that was saved or deleted
+        **kwargs: Signal arguments
+    """
+    invalidate_cache_keys(team_ids_cache_key(instance.department_id))
@@ -3,8 +3,8 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth import login, authenticate, update_session_auth_hash
 from django.contrib.auth.forms import PasswordChangeForm
 from django.contrib import messages
-from django.db.models import Count, Avg, Case, When, F, FloatField, Q, Sum
-from django.http import JsonResponse, HttpResponseForbidden
+from django.db.models import Count, Avg, Case, When, F, FloatField, Prefetch, Q, Sum
+from django.http import Http404, JsonResponse, HttpResponseForbidden
 from django.utils import timezone
 from django.db import transaction
 from datetime import datetime, timedelta
@@ -20,6 +20,19 @@ from .forms import (
     DateRangeForm, TeamSelectionForm
 )
 
+# Summary columns rendered by the summary templates; used with .only() to keep
+# timestamps and unused foreign keys out of the SELECT
+SUMMARY_DISPLAY_FIELDS = (
+    'card__name', 'average_vote', 'progress_summary',
+    'green_percentage', 'amber_percentage', 'red_percentage',
+)
+
+# Summary columns overwritten when bulk_create upserts an existing summary
+SUMMARY_UPSERT_FIELDS = [
+    'average_vote', 'progress_summary',
+    'green_percentage', 'amber_percentage', 'red_percentage', 'updated_at',
+]
+
 def register(request):
     if request.method == 'POST':
         form = UserRegistrationForm(request.POST)
@@ -85,16 +98,18 @@ def dashboard(request):
             # This allows users to see and potentially update their previous votes
             user_votes = {}
             if latest_session:
+                # The dashboard shows only each vote's value, so the comment text is left out
                 votes = Vote.objects.filter(
                     user=user,
                     session=latest_session
-                )
+                ).defer('comment')
                 # Create a dictionary mapping card IDs to vote objects for easy access in template
                 user_votes = {vote.card_id: vote for vote in votes}
                 
             # Team summaries for user's team to show overall team health
             # These are aggregated statistics from all team members' votes
-            team_summaries = TeamSummary.objects.filter(team=user.team)
+            # The card is joined in since the template renders each summary's card name
+            team_summaries = TeamSummary.objects.filter(team=user.team).select_related('card').order_by('-session__date')
             
             context.update({
                 'cards': cards,                     # Health check categories to vote on
@@ -112,11 +127,12 @@ def dashboard(request):
         if team:
             # Get team members for management and tracking participation
             # This allows team leaders to see who has and hasn't voted
-            team_members = User.objects.filter(team=team)
+            # Member lists never show the bio, so its text is left out
+            team_members = User.objects.filter(team=team).defer('bio')
             
             # Get team summaries to monitor overall team health
             # These aggregated statistics help identify trends and issues
-            team_summaries = TeamSummary.objects.filter(team=team)
+            team_summaries = TeamSummary.objects.filter(team=team).select_related('card').order_by('-session__date')
             
             # Get health check cards for team leader's own voting
             # Team leaders also participate in voting like engineers
@@ -132,12 +148,12 @@ def dashboard(request):
                 votes = Vote.objects.filter(
                     user=user,
                     session=latest_session
-                )
+                ).defer('comment')
                 user_votes = {vote.card_id: vote for vote in votes}
             
             # Get other teams in the department for comparison
             # This provides context on how the team is performing relative to peers
-            other_teams = Team.objects.filter(department=department).exclude(id=team.id)
+            other_teams = Team.objects.filter(department=department).exclude(id=team.id).defer('description')
             
             context.update({
                 'team': team,                       # The team being managed
@@ -157,19 +173,23 @@ def dashboard(request):
         if department:
             # Get teams in department for management and comparison
             # This allows department leaders to identify high and low performing teams
-            teams = Team.objects.filter(department=department)
+            # Member counts are annotated so each team card needs no extra query
+            teams = Team.objects.filter(department=department).annotate(member_count=Count('user'))
             
             # Get department summaries to monitor overall department health
             # These are aggregated metrics across all teams in the department
-            department_summaries = DepartmentSummary.objects.filter(department=department)
+            department_summaries = DepartmentSummary.objects.filter(department=department).order_by('-session__date')
             
             # Get team summaries for all teams in department for detailed analysis
             # This allows comparing individual team performance within the department
-            team_summaries = TeamSummary.objects.filter(team__department=department)
+            # Team and card are joined in since the template renders both per summary
+            team_summaries = TeamSummary.objects.filter(
+                team__department=department
+            ).select_related('team', 'card').order_by('-session__date')
             
             # Get other departments for organization-wide context
             # This provides perspective on how the department compares to others
-            other_departments = Department.objects.exclude(id=department.id)
+            other_departments = Department.objects.exclude(id=department.id).defer('description')
             
             context.update({
                 'department': department,                   # The department being managed
@@ -185,15 +205,19 @@ def dashboard(request):
         
         # Get all departments for organization-wide management
         # This provides a complete view of all organizational units
-        departments = Department.objects.all()
+        # Teams are prefetched since the template lists each department's teams;
+        # descriptions are not shown on the dashboard, so their text is left out
+        departments = Department.objects.defer('description').prefetch_related(
+            Prefetch('team_set', queryset=Team.objects.defer('description'))
+        )
         
         # Get all team summaries for detailed analysis
         # This allows drilling down to specific teams when needed
-        team_summaries = TeamSummary.objects.all()
+        team_summaries = TeamSummary.objects.select_related('team', 'card').order_by('-session__date')
         
         # Get all department summaries for organization-wide health monitoring
         # This provides high-level metrics across the entire organization
-        department_summaries = DepartmentSummary.objects.all()
+        department_summaries = DepartmentSummary.objects.order_by('-session__date')
         
         context.update({
             'departments': departments,               # All departments in the organization
@@ -324,6 +348,7 @@ def vote(request, session_id, card_id):
         - Reads from Session, HealthCheckCard, and Vote models
         - Creates or updates Vote records
         - Triggers team summary updates via update_team_summary()
+        - Vote save and summary updates share a single transaction
     """
     # Get session and card objects or return 404 if not found
     # This ensures the requested session and card exist before proceeding
@@ -366,11 +391,14 @@ def vote(request, session_id, card_id):
             vote.user = request.user
             vote.session = session
             vote.card = card
-            vote.save()
-            
-            # Update team summary statistics based on this vote
-            # This ensures team-level aggregations stay current
-            update_team_summary(request.user.team, session, card)
+            # Save the vote and refresh the summaries in one transaction so the
+            # request commits once instead of once per written row
+            with transaction.atomic():
+                vote.save()
+                
+                # Update team summary statistics based on this vote
+                # This ensures team-level aggregations stay current
+                update_team_summary(request.user.team, session, card)
             
             messages.success(request, 'Vote submitted successfully!')
             return redirect('dashboard')
@@ -483,8 +511,8 @@ def vote_all_submit(request, session_id):
         HttpResponse: Redirects to dashboard after processing votes
         
     Database:
-        - Reads from Session, HealthCheckCard, and Vote models
-        - Creates or updates multiple Vote records in a single transaction
+        - Reads from Session and HealthCheckCard models, loading all cards in one query
+        - Creates or updates multiple Vote records with one upsert in a single transaction
         - Triggers team summary updates via update_team_summary()
     """
     # Only process POST requests - redirect others to dashboard
@@ -519,10 +547,16 @@ def vote_all_submit(request, session_id):
     # Use transaction.atomic to ensure all votes are saved or none are
     # This prevents partial updates if an error occurs mid-process
     with transaction.atomic():
+        card_ids = [int(card_id) for card_id in card_ids]  # Convert string IDs to integers
+        # Look up every submitted card in one query; an unknown card is a 404
+        cards = HealthCheckCard.objects.in_bulk(card_ids)
+        if len(cards) != len(set(card_ids)):
+            raise Http404('No HealthCheckCard matches the given query.')
+        
+        # Collect the votes and write them together below, keeping the last
+        # submission per card so the upsert never touches a row twice
+        votes = {}
         for card_id in card_ids:
-            card_id = int(card_id)  # Convert string ID to integer
-            card = get_object_or_404(HealthCheckCard, id=card_id)
-            
             # Get form values for this specific card
             # Form field names are dynamically generated with card ID suffix
             value = request.POST.get(f'value_{card_id}')  # Green/Amber/Red vote
@@ -535,24 +569,31 @@ def vote_all_submit(request, session_id):
                 error_count += 1
                 continue
             
-            # Get existing vote or create new one
-            # This supports both initial voting and updating previous votes
-            try:
-                vote = Vote.objects.get(user=request.user, session=session, card=card)
-            except Vote.DoesNotExist:
-                vote = Vote(user=request.user, session=session, card=card)
-            
-            # Update vote with form values
-            vote.value = value  # Green/Amber/Red status
-            vote.progress_note = progress_note  # Trend direction
-            vote.comment = comment  # Additional context
-            vote.save()
-            
-            # Update team summary statistics based on this vote
-            # This ensures team-level aggregations stay current
-            update_team_summary(request.user.team, session, card)
-            
+            votes[card_id] = Vote(
+                user=request.user,
+                session=session,
+                card=cards[card_id],
+                value=value,  # Green/Amber/Red status
+                # bulk_create skips Vote.save, so the score is set here
+                score=Vote.VALUE_SCORES.get(value, 0),
+                progress_note=progress_note,  # Trend direction
+                comment=comment,  # Additional context
+            )
             success_count += 1
+        
+        # Insert new votes and overwrite existing ones in one statement, which
+        # supports both initial voting and updating previous votes
+        Vote.objects.bulk_create(
+            list(votes.values()),
+            update_conflicts=True,
+            unique_fields=['user', 'card', 'session'],
+            update_fields=['value', 'score', 'progress_note', 'comment', 'updated_at'],
+        )
+        
+        # Update team summary statistics once per card voted on
+        # This ensures team-level aggregations stay current
+        for vote in votes.values():
+            update_team_summary(request.user.team, session, vote.card)
     
     # Provide feedback on successful votes
     if success_count > 0:
@@ -635,11 +676,15 @@ def team_summary(request, team_id=None):
     if team and selected_session:
         # Get team summaries for selected session
         # These are the aggregated metrics for the team's health check
-        summaries = TeamSummary.objects.filter(team=team, session=selected_session)
+        # Only the columns the template renders are loaded, with the card joined in
+        summaries = TeamSummary.objects.filter(
+            team=team, session=selected_session
+        ).select_related('card').only(*SUMMARY_DISPLAY_FIELDS)
         
         # Get team members for context and participation tracking
         # This allows seeing who has contributed to the team's health metrics
-        team_members = User.objects.filter(team=team)
+        # Member cards never show the bio, so its text is left out
+        team_members = User.objects.filter(team=team).defer('bio')
         
         # Get health check cards for context and category information
         # These are the categories being evaluated in the health check
@@ -730,18 +775,19 @@ def department_summary(request, department_id=None):
         dept_summaries = DepartmentSummary.objects.filter(
             department=department, 
             session=selected_session
-        )
+        ).select_related('card').only(*SUMMARY_DISPLAY_FIELDS)
         
         # Get teams in department for detailed breakdown
         # This allows comparing individual teams within the department
-        teams = Team.objects.filter(department=department)
+        # Member counts are annotated so each team card needs no extra query
+        teams = Team.objects.filter(department=department).annotate(member_count=Count('user'))
         
         # Get team summaries for all teams in the department
         # This provides team-level metrics for comparison and analysis
         team_summaries = TeamSummary.objects.filter(
             team__in=teams,
             session=selected_session
-        )
+        ).select_related('card').only('team', *SUMMARY_DISPLAY_FIELDS)
         
         # Get health check cards for context and category information
         # These are the categories being evaluated in the health check
@@ -879,7 +925,8 @@ def progress_chart(request):
         datasets.extend([green_dataset, amber_dataset, red_dataset])
     
     # Process data based on user role
-    if sessions.exists():
+    # Truth-testing evaluates the queryset once and caches the rows for the loops below
+    if sessions:
         session_dates = [session.date.strftime('%Y-%m-%d') for session in sessions]
         
         if user.role == 'engineer':
@@ -948,9 +995,14 @@ def progress_chart(request):
                         # Get team summaries for this team
                         team_data = {'green': {}, 'amber': {}, 'red': {}, 'progress': {}}
                         
+                        # Load the team's summaries for every session in one query and
+                        # look them up by (session, card) instead of a query per pair
+                        summaries = {
+                            (summary.session_id, summary.card_id): summary
+                            for summary in TeamSummary.objects.filter(team=selected_team, session__in=sessions)
+                        }
+                        
                         for session in sessions:
-                            summaries = TeamSummary.objects.filter(team=selected_team, session=session)
-                            
                             for card in cards:
                                 card_key = f"card_{card.id}"
                                 if card_key not in team_data['green']:
@@ -959,13 +1011,13 @@ def progress_chart(request):
                                     team_data['red'][card_key] = []
                                     team_data['progress'][card_key] = []
                                 
-                                try:
-                                    summary = summaries.get(card=card)
+                                summary = summaries.get((session.id, card.id))
+                                if summary is not None:
                                     team_data['green'][card_key].append(summary.green_percentage)
                                     team_data['amber'][card_key].append(summary.amber_percentage)
                                     team_data['red'][card_key].append(summary.red_percentage)
                                     team_data['progress'][card_key].append(summary.progress_summary)
-                                except TeamSummary.DoesNotExist:
+                                else:
                                     team_data['green'][card_key].append(0)
                                     team_data['amber'][card_key].append(0)
                                     team_data['red'][card_key].append(0)
@@ -1008,9 +1060,16 @@ def progress_chart(request):
                             # Get department summaries for this department
                             dept_data = {'green': {}, 'amber': {}, 'red': {}, 'progress': {}}
                             
+                            # Load the department's summaries for every session in one query
+                            # and look them up by (session, card)
+                            summaries = {
+                                (summary.session_id, summary.card_id): summary
+                                for summary in DepartmentSummary.objects.filter(
+                                    department=selected_department, session__in=sessions
+                                )
+                            }
+                            
                             for session in sessions:
-                                summaries = DepartmentSummary.objects.filter(department=selected_department, session=session)
-                                
                                 for card in cards:
                                     card_key = f"card_{card.id}"
                                     if card_key not in dept_data['green']:
@@ -1019,13 +1078,13 @@ def progress_chart(request):
                                         dept_data['red'][card_key] = []
                                         dept_data['progress'][card_key] = []
                                     
-                                    try:
-                                        summary = summaries.get(card=card)
+                                    summary = summaries.get((session.id, card.id))
+                                    if summary is not None:
                                         dept_data['green'][card_key].append(summary.green_percentage)
                                         dept_data['amber'][card_key].append(summary.amber_percentage)
                                         dept_data['red'][card_key].append(summary.red_percentage)
                                         dept_data['progress'][card_key].append(summary.progress_summary)
-                                    except DepartmentSummary.DoesNotExist:
+                                    else:
                                         dept_data['green'][card_key].append(0)
                                         dept_data['amber'][card_key].append(0)
                                         dept_data['red'][card_key].append(0)
@@ -1052,15 +1111,29 @@ def progress_chart(request):
             
             # For senior managers, get all departments
             if user.role == 'senior_manager':
-                departments = Department.objects.all()
+                departments = Department.objects.defer('description')
                 context['departments'] = departments
                 
                 # If neither team nor department are selected, show organization-wide data
                 if not selected_team and not selected_department:
                     org_data = {'green': {}, 'amber': {}, 'red': {}, 'progress': {}}
                     
+                    # Aggregate department summaries for every session and card in a
+                    # single GROUP BY query instead of several queries per pair.
+                    # order_by() clears the default ordering so it stays out of the grouping
+                    org_rows = DepartmentSummary.objects.filter(
+                        session__in=sessions, card__in=cards
+                    ).values('session_id', 'card_id').annotate(
+                        green_avg=Avg('green_percentage'),
+                        amber_avg=Avg('amber_percentage'),
+                        red_avg=Avg('red_percentage'),
+                        better=Count('id', filter=Q(progress_summary='better')),
+                        same=Count('id', filter=Q(progress_summary='same')),
+                        worse=Count('id', filter=Q(progress_summary='worse')),
+                    ).order_by()
+                    org_stats = {(row['session_id'], row['card_id']): row for row in org_rows}
+                    
                     for session in sessions:
-                        # Aggregate department summaries for each card
                         for card in cards:
                             card_key = f"card_{card.id}"
                             if card_key not in org_data['green']:
@@ -1069,22 +1142,18 @@ def progress_chart(request):
                                 org_data['red'][card_key] = []
                                 org_data['progress'][card_key] = []
                             
-                            dept_summaries = DepartmentSummary.objects.filter(session=session, card=card)
+                            row = org_stats.get((session.id, card.id))
                             
-                            if dept_summaries.exists():
-                                green_avg = dept_summaries.aggregate(avg=Avg('green_percentage'))['avg'] or 0
-                                amber_avg = dept_summaries.aggregate(avg=Avg('amber_percentage'))['avg'] or 0
-                                red_avg = dept_summaries.aggregate(avg=Avg('red_percentage'))['avg'] or 0
-                                
-                                org_data['green'][card_key].append(green_avg)
-                                org_data['amber'][card_key].append(amber_avg)
-                                org_data['red'][card_key].append(red_avg)
+                            if row:
+                                org_data['green'][card_key].append(row['green_avg'] or 0)
+                                org_data['amber'][card_key].append(row['amber_avg'] or 0)
+                                org_data['red'][card_key].append(row['red_avg'] or 0)
                                 
                                 # Determine most common progress
                                 progress_counts = {
-                                    'better': dept_summaries.filter(progress_summary='better').count(),
-                                    'same': dept_summaries.filter(progress_summary='same').count(),
-                                    'worse': dept_summaries.filter(progress_summary='worse').count()
+                                    'better': row['better'],
+                                    'same': row['same'],
+                                    'worse': row['worse']
                                 }
                                 
                                 if progress_counts['better'] >= progress_counts['same'] and progress_counts['better'] >= progress_counts['worse']:
@@ -1184,6 +1253,46 @@ def progress_chart(request):
     
     return render(request, 'core/progress_chart.html', context)
 
+def majority_vote(green, amber, red):
+    """
+    Pick the traffic light value with the highest share.
+    
+    Ties resolve in favour of the better value (green over amber over red).
+    
+    Args:
+        green: Green vote count or percentage
+        amber: Amber vote count or percentage
+        red: Red vote count or percentage
+        
+    Returns:
+        String 'green', 'amber', or 'red'
+    """
+    if green >= amber and green >= red:
+        return 'green'  # Green has highest share
+    elif amber >= green and amber >= red:
+        return 'amber'  # Amber has highest share
+    return 'red'        # Red has highest share
+
+def majority_progress(better, same, worse):
+    """
+    Pick the progress direction with the most votes or teams.
+    
+    Ties resolve in favour of the better direction (better over same over worse).
+    
+    Args:
+        better: Number indicating improvement
+        same: Number indicating stability
+        worse: Number indicating decline
+        
+    Returns:
+        String 'better', 'same', or 'worse'
+    """
+    if better >= same and better >= worse:
+        return 'better'  # Most indicate improvement
+    elif same >= better and same >= worse:
+        return 'same'    # Most indicate stability
+    return 'worse'       # Most indicate decline
+
 def update_team_summary(team, session, card):
     """
     Update team summary for a card and session based on team members' votes.
@@ -1199,7 +1308,7 @@ def update_team_summary(team, session, card):
         - Implements majority-wins logic for determining overall status
     
     Performance Optimization:
-        - Uses Django's annotate and values for efficient vote counting
+        - Counts vote values and progress notes in one conditional aggregate
         - Uses update_or_create to minimize database operations
         - Triggers department summary updates only when necessary
     
@@ -1224,48 +1333,34 @@ def update_team_summary(team, session, card):
             card=card         # Filter by specific health check card
         )
         
+        # Count votes by value and by progress note in a single conditional aggregate
+        # This replaces separate exists/count/group-by queries with one round trip
+        counts = votes.aggregate(
+            total=Count('id'),
+            green=Count('id', filter=Q(value='green')),
+            amber=Count('id', filter=Q(value='amber')),
+            red=Count('id', filter=Q(value='red')),
+            better=Count('id', filter=Q(progress_note='better')),
+            same=Count('id', filter=Q(progress_note='same')),
+            worse=Count('id', filter=Q(progress_note='worse')),
+        )
+        total_votes = counts['total']
+        
         # Only proceed if votes exist for this combination
-        if votes.exists():
-            # Count votes by value (green/amber/red) using efficient aggregation
-            # This produces a queryset of dictionaries with value and count pairs
-            vote_counts = votes.values('value').annotate(count=Count('value'))
-            # Convert to a more convenient dictionary format for easier access
-            vote_count_dict = {vc['value']: vc['count'] for vc in vote_counts}
-            
+        if total_votes > 0:
             # Calculate percentages for each vote value
             # These percentages show the distribution of team sentiment
-            total_votes = votes.count()
-            # Handle division by zero with conditional logic
-            green_pct = (vote_count_dict.get('green', 0) / total_votes) * 100 if total_votes > 0 else 0
-            amber_pct = (vote_count_dict.get('amber', 0) / total_votes) * 100 if total_votes > 0 else 0
-            red_pct = (vote_count_dict.get('red', 0) / total_votes) * 100 if total_votes > 0 else 0
+            green_pct = (counts['green'] / total_votes) * 100
+            amber_pct = (counts['amber'] / total_votes) * 100
+            red_pct = (counts['red'] / total_votes) * 100
             
             # Determine average vote using majority-wins logic
             # This represents the team's overall status for this card
-            if green_pct >= amber_pct and green_pct >= red_pct:
-                avg_vote = 'green'  # Green has highest percentage
-            elif amber_pct >= green_pct and amber_pct >= red_pct:
-                avg_vote = 'amber'  # Amber has highest percentage
-            else:
-                avg_vote = 'red'    # Red has highest percentage
-            
-            # Count progress notes (better/same/worse) using efficient aggregation
-            # This shows the team's perception of trend direction
-            progress_counts = votes.values('progress_note').annotate(count=Count('progress_note'))
-            progress_count_dict = {pc['progress_note']: pc['count'] for pc in progress_counts}
+            avg_vote = majority_vote(green_pct, amber_pct, red_pct)
             
             # Determine progress summary using majority-wins logic
             # This represents the team's overall trend perception
-            better_count = progress_count_dict.get('better', 0)
-            same_count = progress_count_dict.get('same', 0)
-            worse_count = progress_count_dict.get('worse', 0)
-            
-            if better_count >= same_count and better_count >= worse_count:
-                progress_summary = 'better'  # Most votes indicate improvement
-            elif same_count >= better_count and same_count >= worse_count:
-                progress_summary = 'same'    # Most votes indicate stability
-            else:
-                progress_summary = 'worse'   # Most votes indicate decline
+            progress_summary = majority_progress(counts['better'], counts['same'], counts['worse'])
             
             # Update or create team summary record with calculated metrics
             # This efficiently handles both new and existing summaries
@@ -1304,8 +1399,7 @@ def update_department_summary(department, session, card):
         - Implements majority-wins logic for determining overall status
     
     Performance Optimization:
-        - Uses Django's aggregate for efficient average calculations
-        - Uses filter and count for progress summary determination
+        - Computes averages and progress counts in one conditional aggregate
         - Uses update_or_create to minimize database operations
     
     Args:
@@ -1328,39 +1422,33 @@ def update_department_summary(department, session, card):
             card=card                     # Filter by specific health check card
         )
         
+        # Average the percentages and count progress summaries in a single aggregate
+        # This replaces an exists check, three averages and three counts
+        stats = team_summaries.aggregate(
+            total=Count('id'),
+            green_pct=Avg('green_percentage'),
+            amber_pct=Avg('amber_percentage'),
+            red_pct=Avg('red_percentage'),
+            better=Count('id', filter=Q(progress_summary='better')),
+            same=Count('id', filter=Q(progress_summary='same')),
+            worse=Count('id', filter=Q(progress_summary='worse')),
+        )
+        
         # Only proceed if team summaries exist for this combination
-        if team_summaries.exists():
-            # Calculate average percentages across all teams in the department
+        if stats['total'] > 0:
+            # Average percentages across all teams in the department
             # This provides department-wide metrics based on team averages
-            green_pct = team_summaries.aggregate(avg=Avg('green_percentage'))['avg']
-            amber_pct = team_summaries.aggregate(avg=Avg('amber_percentage'))['avg']
-            red_pct = team_summaries.aggregate(avg=Avg('red_percentage'))['avg']
+            green_pct = stats['green_pct']
+            amber_pct = stats['amber_pct']
+            red_pct = stats['red_pct']
             
             # Determine average vote using highest-percentage logic
             # This represents the department's overall status for this card
-            if green_pct >= amber_pct and green_pct >= red_pct:
-                avg_vote = 'green'  # Green has highest percentage
-            elif amber_pct >= green_pct and amber_pct >= red_pct:
-                avg_vote = 'amber'  # Amber has highest percentage
-            else:
-                avg_vote = 'red'    # Red has highest percentage
+            avg_vote = majority_vote(green_pct, amber_pct, red_pct)
             
-            # Count team progress summaries to determine department trend
-            # This shows how many teams are improving, stable, or declining
-            progress_counts = {
-                'better': team_summaries.filter(progress_summary='better').count(),
-                'same': team_summaries.filter(progress_summary='same').count(),
-                'worse': team_summaries.filter(progress_summary='worse').count()
-            }
-            
-            # Determine department progress summary using majority-wins logic
-            # This represents the department's overall trend direction
-            if progress_counts['better'] >= progress_counts['same'] and progress_counts['better'] >= progress_counts['worse']:
-                progress_summary = 'better'  # Most teams are improving
-            elif progress_counts['same'] >= progress_counts['better'] and progress_counts['same'] >= progress_counts['worse']:
-                progress_summary = 'same'    # Most teams are stable
-            else:
-                progress_summary = 'worse'   # Most teams are declining
+            # Determine department progress summary from the number of teams
+            # improving, stable, or declining, using majority-wins logic
+            progress_summary = majority_progress(stats['better'], stats['same'], stats['worse'])
             
             # Update or create department summary record with calculated metrics
             # This efficiently handles both new and existing summaries
@@ -1379,6 +1467,95 @@ def update_department_summary(department, session, card):
                 }
             )
 
+def rebuild_summaries(sessions, cards):
+    """
+    Recalculate team and department summaries for many sessions and cards at once.
+    
+    Produces the same summaries as calling update_team_summary for every team,
+    session, and card combination, but with one grouped aggregate and one bulk
+    upsert per summary level instead of several queries per combination. Used
+    when summaries are regenerated in bulk, such as after loading sample data.
+    
+    Args:
+        sessions: Iterable or QuerySet of Session objects to recalculate
+        cards: Iterable or QuerySet of HealthCheckCard objects to recalculate
+        
+    Returns:
+        Tuple of (team summary count, department summary count) written
+    """
+    with transaction.atomic():
+        # Count vote values and progress notes per team, session, and card
+        team_rows = Vote.objects.filter(
+            session__in=sessions, card__in=cards, user__team__isnull=False
+        ).values('user__team_id', 'session_id', 'card_id').annotate(
+            total=Count('id'),
+            green=Count('id', filter=Q(value='green')),
+            amber=Count('id', filter=Q(value='amber')),
+            red=Count('id', filter=Q(value='red')),
+            better=Count('id', filter=Q(progress_note='better')),
+            same=Count('id', filter=Q(progress_note='same')),
+            worse=Count('id', filter=Q(progress_note='worse')),
+        ).order_by()
+        
+        team_summaries = []
+        for row in team_rows:
+            total_votes = row['total']
+            green_pct = (row['green'] / total_votes) * 100
+            amber_pct = (row['amber'] / total_votes) * 100
+            red_pct = (row['red'] / total_votes) * 100
+            team_summaries.append(TeamSummary(
+                team_id=row['user__team_id'],
+                session_id=row['session_id'],
+                card_id=row['card_id'],
+                average_vote=majority_vote(green_pct, amber_pct, red_pct),
+                progress_summary=majority_progress(row['better'], row['same'], row['worse']),
+                green_percentage=green_pct,
+                amber_percentage=amber_pct,
+                red_percentage=red_pct,
+            ))
+        
+        # Insert new summaries and overwrite existing ones in one statement per batch
+        TeamSummary.objects.bulk_create(
+            team_summaries,
+            update_conflicts=True,
+            unique_fields=['team', 'session', 'card'],
+            update_fields=SUMMARY_UPSERT_FIELDS,
+        )
+        
+        # Department summaries average the team summaries written above
+        department_rows = TeamSummary.objects.filter(
+            session__in=sessions, card__in=cards
+        ).values('team__department_id', 'session_id', 'card_id').annotate(
+            green_pct=Avg('green_percentage'),
+            amber_pct=Avg('amber_percentage'),
+            red_pct=Avg('red_percentage'),
+            better=Count('id', filter=Q(progress_summary='better')),
+            same=Count('id', filter=Q(progress_summary='same')),
+            worse=Count('id', filter=Q(progress_summary='worse')),
+        ).order_by()
+        
+        department_summaries = [
+            DepartmentSummary(
+                department_id=row['team__department_id'],
+                session_id=row['session_id'],
+                card_id=row['card_id'],
+                average_vote=majority_vote(row['green_pct'], row['amber_pct'], row['red_pct']),
+                progress_summary=majority_progress(row['better'], row['same'], row['worse']),
+                green_percentage=row['green_pct'],
+                amber_percentage=row['amber_pct'],
+                red_percentage=row['red_pct'],
+            )
+            for row in department_rows
+        ]
+        DepartmentSummary.objects.bulk_create(
+            department_summaries,
+            update_conflicts=True,
+            unique_fields=['department', 'session', 'card'],
+            update_fields=SUMMARY_UPSERT_FIELDS,
+        )
+    
+    return len(team_summaries), len(department_summaries)
+
 def load_teams(request):
     """
     AJAX endpoint to load teams belonging to a specific department.
@@ -1398,17 +1575,19 @@ def load_teams(request):
         
     Database:
         - Reads from Team model filtered by department_id
+        - Selects only the id and name columns, without building model instances
         - Optimizes query with ordering by name for consistent display
     """
     # Get department_id from query parameters
     department_id = request.GET.get('department')
     
     # Query teams belonging to the specified department, ordered alphabetically
-    teams = Team.objects.filter(department_id=department_id).order_by('name')
+    # Only the two dropdown columns are read, as dicts rather than Team instances
+    teams = Team.objects.filter(department_id=department_id).order_by('name').values('id', 'name')
     
     # Return JSON array of team objects with minimal properties needed for dropdown
     # The safe=False parameter allows returning a non-dict object as JSON
-    return JsonResponse([{'id': team.id, 'name': team.name} for team in teams], safe=False)
+    return JsonResponse(list(teams), safe=False)
 
 @login_required
 def team_detail_view(request, team_id):
@@ -1450,20 +1629,15 @@ def team_detail_view(request, team_id):
     if user.role == 'engineer' and user.team != team:
         return HttpResponseForbidden('You do not have permission to view this team.')
     
-    # Get team members for display and participation tracking
-    # This shows who belongs to the team and their voting status
-    members = User.objects.filter(team=team)
-    
     # Get latest session for participation tracking
     # This assumes sessions are ordered by recency (newest first)
     latest_session = Session.objects.first()
     
-    # Flag if each member has voted in latest session
-    # This helps identify team members who haven't participated
-    for member in members:
-        # Check if the member has any votes in the latest session
-        # The conditional handles the case where no sessions exist
-        member.has_voted_in_session = Vote.objects.filter(user=member, session=latest_session).exists() if latest_session else False
+    # Get team members for display and participation tracking
+    # Each member is flagged with whether they voted in the latest session
+    # through an EXISTS subquery in the same query; with no sessions the
+    # flag is False for everyone. The bio is not shown, so its text is left out
+    members = User.annotate_voted(User.objects.filter(team=team).defer('bio'), latest_session)
     
     # Get recent team summaries for health trend analysis
     # Using select_related optimizes the query by fetching related objects
@@ -1518,12 +1692,16 @@ def department_detail_view(request, department_id):
         return HttpResponseForbidden('You do not have permission to view this department.')
     
     # Get department leaders for display and contact information
-    # This shows who is responsible for the department
-    leaders = User.objects.filter(department=department, role='department_leader')
+    # This shows who is responsible for the department; bios are not shown
+    leaders = User.objects.filter(department=department, role='department_leader').defer('bio')
     
     # Get teams in this department for organizational structure
     # This shows all teams that make up the department
-    teams = Team.objects.filter(department=department)
+    # Member and summary counts are annotated so each team card needs no
+    # extra query for its size or health status
+    teams = Team.annotate_health_counts(
+        Team.objects.filter(department=department).defer('description').annotate(member_count=Count('user'))
+    )
     
     # Get recent department summaries for health trend analysis
     # Using select_related optimizes the query by fetching related objects
@@ -1589,7 +1767,8 @@ def health_status_dashboard(request):
     
     # Get teams by health status to identify distribution and at-risk teams
     # This is core functionality for the dashboard - identifying problem areas
-    teams = Team.objects.all()
+    # Summary counts are annotated so each team's status needs no extra query
+    teams = Team.annotate_health_counts(Team.objects.all())
     green_teams = 0  # Teams with good health status
     amber_teams = 0  # Teams with warning health status
     red_teams = 0    # Teams with critical health status
@@ -1615,10 +1794,11 @@ def health_status_dashboard(request):
             # This helps identify the specific area causing the warning status
             if active_session:
                 # Get the summary with lowest green percentage (most concerning)
+                # The card is joined in since only its name is displayed
                 critical_summary = TeamSummary.objects.filter(
                     team=team, 
                     session=active_session
-                ).order_by('green_percentage').first()  # Ascending order - lowest first
+                ).select_related('card').order_by('green_percentage').first()  # Ascending order - lowest first
                 
                 # Store critical card name on team object for display
                 team.critical_card = critical_summary.card.name if critical_summary else 'Unknown'
@@ -1638,7 +1818,7 @@ def health_status_dashboard(request):
                     team=team, 
                     session=active_session, 
                     average_vote='red'  # Only consider cards with red status
-                ).first()
+                ).select_related('card').first()
                 
                 # Store critical card name on team object for display
                 team.critical_card = critical_summary.card.name if critical_summary else 'Unknown'
@@ -1651,7 +1831,9 @@ def health_status_dashboard(request):
     declining_count = 0  # Count of declining metrics
     
     # Analyze all team summaries to determine trend distributions
-    team_summaries = TeamSummary.objects.all()
+    # Each summary's predecessor is found by a window in the same query, so the
+    # trends need no lookup per summary
+    team_summaries = TeamSummary.annotate_trends(TeamSummary.objects.all())
     for summary in team_summaries:
         # Calculate trend direction using TeamSummary model method
         trend = summary.calculate_trend()
@@ -1,5 +1,6 @@
 
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -96,6 +97,11 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# The test suite creates many users with throwaway passwords; hash them with the
+# fast MD5 hasher instead of PBKDF2 while running tests
+if len(sys.argv) > 1 and sys.argv[1] == 'test':
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'